@@ -1,5 +1,20 @@
 """SNS announcement module."""
-from .service import AnnouncementService
-from .message import MessageGenerator
+from __future__ import annotations
+
+import importlib
 
 __all__ = ["AnnouncementService", "MessageGenerator"]
+
+# Exported name -> submodule. Resolved on first access, so importing the queue
+# submodule does not pull in the SNS clients or build the wide-character table.
+_EXPORTS = {
+    "AnnouncementService": ".service",
+    "MessageGenerator": ".message",
+}
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module, __name__), name)
@@ -3,54 +3,119 @@ from __future__ import annotations
 
 import re
 import unicodedata
+from dataclasses import dataclass
 
 from ..transformer.article import Article
 
+# Twitter counts every URL as this many characters regardless of its length
+_URL_WEIGHT = 23
+_URL_RE = re.compile(r"https?://\S+")
+# Largest amount a URL can weigh above 2 per character (shortest match is "http://x")
+_MAX_URL_EXCESS = _URL_WEIGHT - 2 * len("http://x")
+
+# Platforms whose published URL is linked from SNS posts, in priority order
+_URL_PRIORITY = ("blog", "zenn", "qiita")
+
+# Codepoints covered by the wide-character table (BMP + SMP)
+_WIDE_LIMIT = 0x20000
+
+# East Asian Width classes that Twitter counts as 2
+_WIDE_CLASSES = frozenset(("W", "F"))
+_east_asian_width = unicodedata.east_asian_width
+
+
+def _build_wide_table() -> str:
+    """Build a translation table mapping each codepoint to "\\x01" (wide) or "\\x00".
+
+    ``str.translate`` with this table classifies a whole string in C; the wide
+    characters are then counted with ``str.count``.
+    """
+    return bytes(
+        _east_asian_width(chr(cp)) in _WIDE_CLASSES for cp in range(_WIDE_LIMIT)
+    ).decode("latin-1")
+
+
+_WIDE_TABLE = _build_wide_table()
+
+
+def _char_weight(cp: int) -> int:
+    """Return Twitter's weight (1 or 2) for a single codepoint."""
+    if cp < _WIDE_LIMIT:
+        return 1 + ord(_WIDE_TABLE[cp])
+    return 2 if _east_asian_width(chr(cp)) in _WIDE_CLASSES else 1
+
+
+def _weighted_plain(text: str, start: int, end: int) -> int:
+    """Weighted length of ``text[start:end]``, which must contain no URLs."""
+    flags = text[start:end].translate(_WIDE_TABLE)
+    count = len(flags) + flags.count("\x01")
+    if not flags.isascii():
+        # Codepoints beyond the table are left untranslated; weigh them individually
+        count += sum(_char_weight(ord(ch)) - 1 for ch in flags if not ch.isascii())
+    return count
+
+
+def _weighted_atoms(text: str):
+    """Yield ``(piece, weight)`` pairs: single characters, or whole URLs as one atom."""
+    pos = 0
+    for m in _URL_RE.finditer(text):
+        for ch in text[pos:m.start()]:
+            yield ch, _char_weight(ord(ch))
+        yield m.group(0), _URL_WEIGHT
+        pos = m.end()
+    for ch in text[pos:]:
+        yield ch, _char_weight(ord(ch))
+
+
+def _weighted_len_upper_bound(text: str) -> int:
+    """Cheap upper bound of ``twitter_weighted_len`` (no per-character scan).
+
+    Every character weighs at most 2, and each URL (which contains "://") can
+    add at most ``_MAX_URL_EXCESS`` on top of that.
+    """
+    return 2 * len(text) + _MAX_URL_EXCESS * text.count("://")
+
 
 def twitter_weighted_len(text: str) -> int:
     """Calculate Twitter's weighted character count.
 
     Twitter counts CJK/full-width characters as 2 and URLs as 23.
     """
-    text_no_urls = re.sub(r"https?://\S+", "x" * 23, text)
+    if text.isascii():
+        # Every ASCII character weighs 1, so only the URLs need adjusting
+        return len(text) + sum(_URL_WEIGHT - len(url) for url in _URL_RE.findall(text))
     count = 0
-    for ch in text_no_urls:
-        if unicodedata.east_asian_width(ch) in ("W", "F"):
-            count += 2
-        else:
-            count += 1
-    return count
+    pos = 0
+    for m in _URL_RE.finditer(text):
+        count += _weighted_plain(text, pos, m.start()) + _URL_WEIGHT
+        pos = m.end()
+    return count + _weighted_plain(text, pos, len(text))
 
 
 def twitter_weighted_truncate(text: str, max_len: int) -> str:
     """Truncate text to fit within Twitter's weighted character limit."""
-    if twitter_weighted_len(text) <= max_len:
+    if _weighted_len_upper_bound(text) <= max_len or twitter_weighted_len(text) <= max_len:
         return text
     result = []
     count = 0
-    i = 0
-    while i < len(text):
-        # Detect URL start
-        if text[i:].startswith("http://") or text[i:].startswith("https://"):
-            url_match = re.match(r"https?://\S+", text[i:])
-            if url_match:
-                url = url_match.group(0)
-                if count + 23 > max_len:
-                    break
-                result.append(url)
-                count += 23
-                i += len(url)
-                continue
-        ch = text[i]
-        w = 2 if unicodedata.east_asian_width(ch) in ("W", "F") else 1
+    for piece, w in _weighted_atoms(text):
         if count + w > max_len:
             break
-        result.append(ch)
+        result.append(piece)
         count += w
-        i += 1
     return "".join(result)
 
 
+@dataclass
+class MessageParts:
+    """Platform-independent pieces of an announcement, prepared once per article."""
+
+    article: Article
+    urls: dict[str, str]
+    primary_url: str
+    hashtags: tuple[str, ...]  # "#tag" strings for the leading tags
+
+
 class MessageGenerator:
     """Generate platform-optimized announcement messages."""
 
@@ -59,6 +124,10 @@ class MessageGenerator:
     BLUESKY_MAX_LENGTH = 300
     MISSKEY_MAX_LENGTH = 3000
 
+    # Number of tags turned into hashtags per platform
+    TWITTER_HASHTAGS = 3
+    MISSKEY_HASHTAGS = 5
+
     def generate(
         self,
         article: Article,
@@ -72,63 +141,97 @@ class MessageGenerator:
             platform: Target SNS platform (twitter, bluesky, misskey)
             urls: Dict of platform -> published URL
         """
-        if platform == "twitter":
-            return self._generate_twitter(article, urls)
-        elif platform == "bluesky":
-            return self._generate_bluesky(article, urls)
-        elif platform == "misskey":
-            return self._generate_misskey(article, urls)
-        else:
-            return self._generate_default(article, urls)
+        return self.generate_from_parts(self.prepare(article, urls), platform)
+
+    def generate_all(
+        self,
+        article: Article,
+        platforms: list[str],
+        urls: dict[str, str],
+    ) -> dict[str, str]:
+        """Generate messages for several platforms, sharing the per-article preparation."""
+        parts = self.prepare(article, urls)
+        return {platform: self.generate_from_parts(parts, platform) for platform in platforms}
+
+    def generate_from_parts(self, parts: MessageParts, platform: str) -> str:
+        """Generate a platform message from prepared parts."""
+        handler = self._DISPATCH.get(platform, type(self)._generate_default)
+        return handler(self, parts)
+
+    def prepare(self, article: Article, urls: dict[str, str]) -> MessageParts:
+        """Compute the platform-independent message parts for an article."""
+        return MessageParts(
+            article=article,
+            urls=urls,
+            primary_url=self._get_primary_url(urls),
+            hashtags=article.hashtags,
+        )
 
     def _get_primary_url(self, urls: dict[str, str]) -> str:
         """Get the primary URL for SNS (blog only)."""
-        return urls.get("blog") or urls.get("zenn") or urls.get("qiita") or ""
-
-    def _generate_twitter(self, article: Article, urls: dict[str, str]) -> str:
+        for key in _URL_PRIORITY:
+            url = urls.get(key)
+            if url:
+                # --urls is free-form JSON: render non-string values as text, not crash
+                return str(url)
+        return ""
+
+    def _generate_twitter(self, parts: MessageParts) -> str:
         """Generate Twitter-optimized message (280 weighted char limit).
 
         Twitter counts CJK/full-width characters as 2 and URLs as 23.
         """
-        url = self._get_primary_url(urls)
-        hashtags = " ".join(f"#{tag}" for tag in article.tags[:3])
+        article = parts.article
+        hashtags = " ".join(parts.hashtags[:self.TWITTER_HASHTAGS])
 
-        msg = f"{article.title}\n\n{article.description[:120]}"
+        lines = [article.title, article.description[:120]]
+        if parts.primary_url:
+            lines.append(parts.primary_url)
 
-        if url:
-            msg += f"\n\n{url}"
+        # Short messages fit even if every character is wide: skip the precise count
+        with_tags = "\n\n".join([*lines, hashtags])
+        if _weighted_len_upper_bound(with_tags) <= self.TWITTER_MAX_LENGTH:
+            return with_tags
 
-        if twitter_weighted_len(msg) + twitter_weighted_len(hashtags) + 2 <= self.TWITTER_MAX_LENGTH:
-            msg += f"\n\n{hashtags}"
+        # Separators are whitespace, so the weighted length of the joined message is the
+        # sum of its parts plus 2 per "\n\n" (including the one before the hashtags)
+        body_len = sum(map(twitter_weighted_len, lines)) + 2 * len(lines)
+        if body_len + twitter_weighted_len(hashtags) <= self.TWITTER_MAX_LENGTH:
+            return twitter_weighted_truncate(with_tags, self.TWITTER_MAX_LENGTH)
 
-        return twitter_weighted_truncate(msg, self.TWITTER_MAX_LENGTH)
+        return twitter_weighted_truncate("\n\n".join(lines), self.TWITTER_MAX_LENGTH)
 
-    def _generate_bluesky(self, article: Article, urls: dict[str, str]) -> str:
+    def _generate_bluesky(self, parts: MessageParts) -> str:
         """Generate Bluesky message."""
-        url = self._get_primary_url(urls)
-
-        msg = f"{article.title}\n\n{article.description[:150]}"
+        article = parts.article
 
-        if url:
-            msg += f"\n\n{url}"
+        lines = [article.title, article.description[:150]]
+        if parts.primary_url:
+            lines.append(parts.primary_url)
 
-        return msg[:self.BLUESKY_MAX_LENGTH]
+        return "\n\n".join(lines)[:self.BLUESKY_MAX_LENGTH]
 
-    def _generate_misskey(self, article: Article, urls: dict[str, str]) -> str:
+    def _generate_misskey(self, parts: MessageParts) -> str:
         """Generate Misskey message (supports Markdown)."""
-        url = self._get_primary_url(urls)
-        hashtags = " ".join(f"#{tag}" for tag in article.tags[:5])
+        article = parts.article
 
-        msg = f"**{article.title}**\n\n{article.description}"
+        lines = [f"**{article.title}**", article.description]
+        if parts.primary_url:
+            lines.append(parts.primary_url)
+        lines.append(" ".join(parts.hashtags[:self.MISSKEY_HASHTAGS]))
 
-        if url:
-            msg += f"\n\n{url}"
+        return "\n\n".join(lines)[:self.MISSKEY_MAX_LENGTH]
 
-        msg += f"\n\n{hashtags}"
-        return msg[:self.MISSKEY_MAX_LENGTH]
-
-    def _generate_default(self, article: Article, urls: dict[str, str]) -> str:
+    def _generate_default(self, parts: MessageParts) -> str:
         """Generate default message."""
-        url = urls.get("blog") or list(urls.values())[0] if urls else ""
+        urls = parts.urls
+        url = urls.get("blog") or next(iter(urls.values()), "")
+
+        return f"新記事公開: {parts.article.title}\n{url}"
 
-        return f"新記事公開: {article.title}\n{url}"
+    # Platform -> generator method (unknown platforms fall back to _generate_default)
+    _DISPATCH = {
+        "twitter": _generate_twitter,
+        "bluesky": _generate_bluesky,
+        "misskey": _generate_misskey,
+    }
@@ -0,0 +1,73 @@
+"""Durable queue of SNS announcements deferred from the publish command."""
+from __future__ import annotations
+
+import json
+import logging
+import os
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+
+from ..fsutil import write_atomic
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PendingAnnouncement:
+    """An announcement waiting to be posted."""
+
+    article_path: str
+    published_urls: dict[str, str]
+    platforms: list[str]
+    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
+
+
+class AnnouncementQueue:
+    """Store pending announcements as JSON files, one file per article publish."""
+
+    def __init__(self, queue_path: str | None = None):
+        self.queue_path = Path(
+            queue_path
+            or os.getenv("ANNOUNCE_QUEUE_PATH", "~/.cache/article-publisher/pending")
+        ).expanduser()
+
+    def enqueue(self, item: PendingAnnouncement, slug: str) -> Path:
+        """Write a pending announcement and return its file path."""
+        self.queue_path.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.now().strftime("%Y%m%d%H%M%S%f")
+        # Timestamp first, so the file names also sort oldest first
+        path = self.queue_path / f"{stamp}-{slug}.json"
+        write_atomic(path, json.dumps(asdict(item), ensure_ascii=False))
+        return path
+
+    def pending(self) -> list[tuple[Path, PendingAnnouncement]]:
+        """Return queued announcements, oldest first.
+
+        A record that cannot be read is renamed to ``*.json.bad`` and skipped,
+        so it cannot block the rest of the queue.
+        """
+        if not self.queue_path.exists():
+            return []
+        items = []
+        for path in self.queue_path.glob("*.json"):
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+                items.append((path, PendingAnnouncement(**data)))
+            except (ValueError, TypeError) as e:
+                # ValueError covers JSONDecodeError and UnicodeDecodeError;
+                # TypeError a record that is not an object or has other fields
+                bad = path.with_name(path.name + ".bad")
+                logger.warning(f"Skipping unreadable queued announcement {path} ({e}); moved to {bad}")
+                os.replace(path, bad)
+        # created_at is ISO 8601, so it also orders records written before the stamp-first names
+        items.sort(key=lambda entry: entry[1].created_at)
+        return items
+
+    def update(self, path: Path, item: PendingAnnouncement) -> None:
+        """Rewrite a queued announcement (e.g. to keep only failed platforms)."""
+        write_atomic(path, json.dumps(asdict(item), ensure_ascii=False))
+
+    def remove(self, path: Path) -> None:
+        """Drop a queued announcement once it has been posted."""
+        path.unlink(missing_ok=True)
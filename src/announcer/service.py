@@ -4,9 +4,11 @@ from __future__ import annotations
 import asyncio
 import os
 import logging
+import time
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 
+from ..jsonutil import dumps_bytes
 from ..transformer.article import Article
 from .message import MessageGenerator
 
@@ -26,6 +28,18 @@ except ImportError:
     HTTPX_AVAILABLE = False
 
 
+# RFC 3339 UTC timestamp for Bluesky's createdAt field
+_BSKY_TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
+
+# Web URL templates for posted messages
+_TWEET_URL = "https://twitter.com/i/web/status/{}".format
+_BSKY_POST_URL = "https://bsky.app/profile/{}/post/{}".format
+_MISSKEY_NOTE_URL = "https://{}/notes/{}".format
+
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
 @dataclass
 class AnnounceResult:
     """Result of an announcement operation."""
@@ -77,12 +91,13 @@ class TwitterAnnouncer:
             )
 
         try:
-            response = self._client.create_tweet(text=message)
+            # tweepy is synchronous; run it off the loop so other platforms post concurrently
+            response = await asyncio.to_thread(self._client.create_tweet, text=message)
             tweet_id = response.data["id"]
             return AnnounceResult(
                 success=True,
                 platform="twitter",
-                url=f"https://twitter.com/i/web/status/{tweet_id}"
+                url=_TWEET_URL(tweet_id)
             )
         except Exception as e:
             logger.error(f"Twitter post failed: {e}")
@@ -93,7 +108,24 @@ class TwitterAnnouncer:
             )
 
 
-class BlueskyAnnouncer:
+class _HttpAnnouncer:
+    """Base for announcers that keep one httpx.AsyncClient between posts."""
+
+    _client: httpx.AsyncClient | None = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        # Reuse one client so consecutive requests share a connection
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=10.0)
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+class BlueskyAnnouncer(_HttpAnnouncer):
     """Bluesky announcement handler using AT Protocol."""
 
     def __init__(self):
@@ -108,14 +140,14 @@ class BlueskyAnnouncer:
         if not self.handle or not self.password:
             return False
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                "https://bsky.social/xrpc/com.atproto.server.createSession",
-                json={"identifier": self.handle, "password": self.password}
-            )
-            if response.status_code == 200:
-                self._session = response.json()
-                return True
+        response = await self._get_client().post(
+            "https://bsky.social/xrpc/com.atproto.server.createSession",
+            content=dumps_bytes({"identifier": self.handle, "password": self.password}),
+            headers=_JSON_HEADERS,
+        )
+        if response.status_code == 200:
+            self._session = response.json()
+            return True
         return False
 
     async def post(self, message: str) -> AnnounceResult:
@@ -127,43 +159,44 @@ class BlueskyAnnouncer:
             )
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    "https://bsky.social/xrpc/com.atproto.repo.createRecord",
-                    headers={"Authorization": f"Bearer {self._session['accessJwt']}"},
-                    json={
-                        "repo": self._session["did"],
-                        "collection": "app.bsky.feed.post",
-                        "record": {
-                            "$type": "app.bsky.feed.post",
-                            "text": message,
-                            "createdAt": datetime.utcnow().isoformat() + "Z"
-                        }
+            response = await self._get_client().post(
+                "https://bsky.social/xrpc/com.atproto.repo.createRecord",
+                headers={
+                    **_JSON_HEADERS,
+                    "Authorization": f"Bearer {self._session['accessJwt']}",
+                },
+                content=dumps_bytes({
+                    "repo": self._session["did"],
+                    "collection": "app.bsky.feed.post",
+                    "record": {
+                        "$type": "app.bsky.feed.post",
+                        "text": message,
+                        "createdAt": datetime.now(timezone.utc).strftime(_BSKY_TIMESTAMP_FORMAT)
                     }
-                )
-
-                if response.status_code == 200:
-                    data = response.json()
-                    uri = data.get("uri", "")
-                    # Convert AT URI to web URL
-                    parts = uri.split("/")
-                    if len(parts) >= 5:
-                        rkey = parts[-1]
-                        web_url = f"https://bsky.app/profile/{self.handle}/post/{rkey}"
-                        return AnnounceResult(success=True, platform="bluesky", url=web_url)
-
-                return AnnounceResult(
-                    success=False,
-                    platform="bluesky",
-                    error=f"HTTP {response.status_code}"
-                )
+                }),
+            )
+
+            if response.status_code == 200:
+                data = response.json()
+                uri = data.get("uri", "")
+                # Convert AT URI (at://{did}/{collection}/{rkey}) to web URL
+                if uri.startswith("at://"):
+                    rkey = uri.rsplit("/", 1)[-1]
+                    web_url = _BSKY_POST_URL(self.handle, rkey)
+                    return AnnounceResult(success=True, platform="bluesky", url=web_url)
+
+            return AnnounceResult(
+                success=False,
+                platform="bluesky",
+                error=f"HTTP {response.status_code}"
+            )
 
         except Exception as e:
             logger.error(f"Bluesky post failed: {e}")
             return AnnounceResult(success=False, platform="bluesky", error=str(e))
 
 
-class MisskeyAnnouncer:
+class MisskeyAnnouncer(_HttpAnnouncer):
     """Misskey announcement handler."""
 
     def __init__(self):
@@ -182,69 +215,114 @@ class MisskeyAnnouncer:
             )
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"https://{self.instance}/api/notes/create",
-                    json={
-                        "i": self.token,
-                        "text": message,
-                        "visibility": "public"
-                    }
-                )
-
-                if response.status_code == 200:
-                    data = response.json()
-                    note_id = data.get("createdNote", {}).get("id")
-                    if note_id:
-                        return AnnounceResult(
-                            success=True,
-                            platform="misskey",
-                            url=f"https://{self.instance}/notes/{note_id}"
-                        )
-
-                return AnnounceResult(
-                    success=False,
-                    platform="misskey",
-                    error=f"HTTP {response.status_code}"
-                )
+            response = await self._get_client().post(
+                f"https://{self.instance}/api/notes/create",
+                headers=_JSON_HEADERS,
+                content=dumps_bytes({
+                    "i": self.token,
+                    "text": message,
+                    "visibility": "public"
+                }),
+            )
+
+            if response.status_code == 200:
+                data = response.json()
+                note_id = data.get("createdNote", {}).get("id")
+                if note_id:
+                    return AnnounceResult(
+                        success=True,
+                        platform="misskey",
+                        url=_MISSKEY_NOTE_URL(self.instance, note_id)
+                    )
+
+            return AnnounceResult(
+                success=False,
+                platform="misskey",
+                error=f"HTTP {response.status_code}"
+            )
 
         except Exception as e:
             logger.error(f"Misskey post failed: {e}")
             return AnnounceResult(success=False, platform="misskey", error=str(e))
 
 
+# Platform -> announcer class
+_ANNOUNCERS = {
+    "twitter": TwitterAnnouncer,
+    "bluesky": BlueskyAnnouncer,
+    "misskey": MisskeyAnnouncer,
+}
+
+
 class AnnouncementService:
     """Orchestrates announcements across multiple SNS platforms."""
 
-    # Delay between platform posts (seconds)
+    # Minimum delay between consecutive posts to the same platform (seconds)
     POST_INTERVAL = 300  # 5 minutes
 
     def __init__(self):
         self.message_generator = MessageGenerator()
+        # Announcers are created on first use (see get_announcer)
         self._announcers: dict = {}
+        self._unavailable: set[str] = set()
+        # Serialize posts per platform; different platforms are posted concurrently
+        self._platform_locks: dict[str, asyncio.Lock] = {}
+        self._last_post_at: dict[str, float] = {}
 
-        # Initialize available announcers
-        try:
-            self._announcers["twitter"] = TwitterAnnouncer()
-        except ImportError:
-            logger.warning("Twitter announcer not available (tweepy not installed)")
+    def get_announcer(self, platform: str):
+        """Return the announcer for a platform, creating it on first use.
+
+        Returns None for unknown platforms and for platforms whose client
+        library is not installed.
+        """
+        announcer = self._announcers.get(platform)
+        if announcer is not None or platform in self._unavailable:
+            return announcer
 
+        announcer_class = _ANNOUNCERS.get(platform)
+        if announcer_class is None:
+            return None
         try:
-            self._announcers["bluesky"] = BlueskyAnnouncer()
-            self._announcers["misskey"] = MisskeyAnnouncer()
-        except ImportError:
-            logger.warning("Bluesky/Misskey announcers not available (httpx not installed)")
+            announcer = self._announcers[platform] = announcer_class()
+        except ImportError as e:
+            logger.warning(f"{platform} announcer not available ({e})")
+            self._unavailable.add(platform)
+        return announcer
+
+    def available_platforms(self) -> list[str]:
+        """Return the platforms whose announcer can be created."""
+        return [p for p in _ANNOUNCERS if self.get_announcer(p) is not None]
+
+    async def __aenter__(self) -> AnnouncementService:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close HTTP clients held by the announcers.
+
+        The service stays usable: clients are reopened on the next post, and
+        locks are recreated so a later event loop (another asyncio.run) can use them.
+        """
+        for announcer in self._announcers.values():
+            close = getattr(announcer, "aclose", None)
+            if close is not None:
+                await close()
+        self._platform_locks.clear()
 
     async def announce_all(
         self,
         article: Article,
         published_urls: dict[str, str],
+        semaphore: asyncio.Semaphore | None = None,
     ) -> list[AnnounceResult]:
         """Announce article publication to all configured platforms.
 
         Args:
             article: The published article
             published_urls: Dict of platform -> published URL
+            semaphore: Optional limit on concurrent posts, shared with the caller
 
         Returns:
             List of AnnounceResult for each platform
@@ -253,31 +331,58 @@ class AnnouncementService:
             logger.info("Announcements disabled for this article")
             return []
 
-        results = []
-        platforms = article.announcement.platforms
-
-        for i, platform in enumerate(platforms):
-            if platform not in self._announcers:
+        available = []
+        for platform in article.announcement.platforms:
+            if self.get_announcer(platform) is not None:
+                available.append(platform)
+            else:
                 logger.warning(f"Announcer not available for {platform}")
-                continue
 
-            # Generate platform-specific message
-            message = self.message_generator.generate(article, platform, published_urls)
+        # Generate all platform-specific messages up front from shared parts
+        messages = self.message_generator.generate_all(article, available, published_urls)
 
-            # Post with delay between platforms
-            if i > 0:
-                await asyncio.sleep(self.POST_INTERVAL)
+        outcomes = await asyncio.gather(
+            *(self._post(platform, messages[platform], semaphore) for platform in available),
+            return_exceptions=True,
+        )
 
-            result = await self._announcers[platform].post(message)
-            results.append(result)
-
-            if result.success:
-                logger.info(f"Announced to {platform}: {result.url}")
+        results = []
+        for platform, outcome in zip(available, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error(f"{platform} announcement raised: {outcome}")
+                outcome = AnnounceResult(success=False, platform=platform, error=str(outcome))
+            results.append(outcome)
+
+            if outcome.success:
+                logger.info(f"Announced to {platform}: {outcome.url}")
             else:
-                logger.error(f"Failed to announce to {platform}: {result.error}")
+                logger.error(f"Failed to announce to {platform}: {outcome.error}")
 
         return results
 
+    async def _post(
+        self, platform: str, message: str, semaphore: asyncio.Semaphore | None = None
+    ) -> AnnounceResult:
+        """Post to one platform, keeping POST_INTERVAL between posts to that platform.
+
+        ``semaphore`` is taken only around the request itself, so tasks waiting
+        out the interval for one platform do not hold slots other platforms need.
+        """
+        lock = self._platform_locks.setdefault(platform, asyncio.Lock())
+        async with lock:
+            last = self._last_post_at.get(platform)
+            if last is not None:
+                wait = self.POST_INTERVAL - (time.monotonic() - last)
+                if wait > 0:
+                    await asyncio.sleep(wait)
+            try:
+                if semaphore is None:
+                    return await self._announcers[platform].post(message)
+                async with semaphore:
+                    return await self._announcers[platform].post(message)
+            finally:
+                self._last_post_at[platform] = time.monotonic()
+
     async def announce_single(
         self,
         article: Article,
@@ -285,7 +390,7 @@ class AnnouncementService:
         published_urls: dict[str, str],
     ) -> AnnounceResult:
         """Announce to a single platform."""
-        if platform not in self._announcers:
+        if self.get_announcer(platform) is None:
             return AnnounceResult(
                 success=False,
                 platform=platform,
@@ -293,4 +398,4 @@ class AnnouncementService:
             )
 
         message = self.message_generator.generate(article, platform, published_urls)
-        return await self._announcers[platform].post(message)
+        return await self._post(platform, message)
@@ -2,22 +2,21 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import json
+import string
 from pathlib import Path
-from typing import Optional
-
-from dotenv import load_dotenv
-load_dotenv()
+from typing import TYPE_CHECKING, Optional
 
 import typer
 from rich.console import Console
-from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from .transformer.parser import ArticleParser
-from .transformer.converter import ConverterFactory
-from .publishers.qiita import QiitaPublisher
-from .publishers.zenn import ZennPublisher
-from .announcer.service import AnnouncementService
+if TYPE_CHECKING:
+    from .transformer.converter import PlatformConverter
+    from .transformer.parser import ArticleParser
+
+# The parser, converters, publishers, the announcer and Rich widgets are imported
+# inside the commands that use them, so short commands (--help, init) start quickly.
 
 app = typer.Typer(
     name="publisher",
@@ -27,13 +26,58 @@ app = typer.Typer(
 console = Console(force_terminal=True)
 
 
+def _split_platforms(values: list[str]) -> list[str]:
+    """Flatten repeated -p options, each of which may also be comma-separated."""
+    return [p.strip() for value in values for p in value.split(",") if p.strip()]
+
+
+@functools.cache
+def _parser() -> ArticleParser:
+    """Shared ArticleParser (stateless, so one instance serves every command)."""
+    from .transformer.parser import ArticleParser
+
+    return ArticleParser()
+
+
+def _get_converter(platform: str) -> PlatformConverter:
+    """Return the converter for a platform (raises ValueError if unknown)."""
+    from .transformer.converter import ConverterFactory
+
+    return ConverterFactory.get_converter(platform)
+
+
+def _run(coro):
+    """Run a command's coroutine on uvloop when it is installed, else on asyncio's loop."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+    return uvloop.run(coro)
+
+
+@functools.cache
+def _announcement_service():
+    """Shared AnnouncementService; its HTTP clients are reopened after each aclose()."""
+    from .announcer.service import AnnouncementService
+
+    return AnnouncementService()
+
+
+@app.callback()
+def main():
+    """Load .env before running any command."""
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+
 @app.command()
 def publish(
     article_path: str = typer.Argument(..., help="Path to the article markdown file"),
-    platforms: Optional[str] = typer.Option(
+    platforms: Optional[list[str]] = typer.Option(
         None,
         "--platforms", "-p",
-        help="Comma-separated list of platforms (note,zenn,qiita,blog). If not specified, uses frontmatter config."
+        help="Platforms to publish to (note, zenn, qiita, blog); repeat -p or separate with commas. If not specified, uses frontmatter config."
     ),
     dry_run: bool = typer.Option(
         False,
@@ -45,6 +89,11 @@ def publish(
         "--no-announce",
         help="Skip SNS announcements"
     ),
+    async_announce: bool = typer.Option(
+        False,
+        "--async-announce",
+        help="Queue SNS announcements instead of posting now (send with 'announce --flush-pending')"
+    ),
     ogp: bool = typer.Option(
         False,
         "--ogp",
@@ -55,21 +104,78 @@ def publish(
         "--ogp-theme",
         help="OGP image color theme: default, purple, green, orange"
     ),
+    max_concurrency: int = typer.Option(
+        4,
+        "--max-concurrency",
+        min=1,
+        help="Maximum number of concurrent publish/announce requests"
+    ),
 ):
     """Publish an article to configured platforms."""
-    asyncio.run(_publish_async(article_path, platforms, dry_run, no_announce, ogp, ogp_theme))
+    _run(
+        _publish_async(
+            article_path, platforms, dry_run, no_announce, ogp, ogp_theme, max_concurrency,
+            async_announce,
+        )
+    )
+
+
+@app.command(name="publish-batch")
+def publish_batch(
+    article_paths: list[str] = typer.Argument(..., help="Paths to the article markdown files"),
+    platforms: Optional[list[str]] = typer.Option(
+        None,
+        "--platforms", "-p",
+        help="Platforms for every article; repeat -p or separate with commas. If not specified, uses each article's frontmatter config."
+    ),
+    no_announce: bool = typer.Option(
+        False,
+        "--no-announce",
+        help="Skip SNS announcements"
+    ),
+    async_announce: bool = typer.Option(
+        False,
+        "--async-announce",
+        help="Queue SNS announcements instead of posting now (send with 'announce --flush-pending')"
+    ),
+    ogp_theme: str = typer.Option(
+        "default",
+        "--ogp-theme",
+        help="OGP image color theme for missing images: default, purple, green, orange"
+    ),
+    max_concurrency: int = typer.Option(
+        8,
+        "--max-concurrency",
+        min=1,
+        help="Maximum number of concurrent publish/announce requests across all articles"
+    ),
+):
+    """Publish several articles in one run, sharing connections and the browser."""
+    _run(
+        _publish_batch_async(
+            article_paths, platforms, no_announce, async_announce, ogp_theme, max_concurrency
+        )
+    )
 
 
 async def _publish_async(
     article_path: str,
-    platforms: Optional[str],
+    platforms: Optional[list[str]],
     dry_run: bool,
     no_announce: bool,
     ogp: bool = False,
     ogp_theme: str = "default",
+    max_concurrency: int = 4,
+    async_announce: bool = False,
 ):
     """Async implementation of publish command."""
-    parser = ArticleParser()
+    from rich.live import Live
+    from rich.spinner import Spinner
+    from rich.table import Table
+
+    from .publishers.context import PublishContext
+
+    parser = _parser()
 
     # Parse article
     with console.status(spinner="line", status="Parsing article..."):
@@ -88,123 +194,358 @@ async def _publish_async(
 
     # Determine target platforms
     if platforms:
-        target_platforms = [p.strip() for p in platforms.split(",")]
+        target_platforms = _split_platforms(platforms)
     else:
         target_platforms = article.get_enabled_platforms()
 
     console.print(f"\n[bold]Target platforms:[/bold] {', '.join(target_platforms)}")
 
-    # Generate OGP image (auto for note/zenn, or when --ogp flag is set)
-    ogp_path = None
-    ogp_file = f"articles/images/{article.slug}-ogp.png"
-    needs_ogp = ogp or any(p in target_platforms for p in ("note", "zenn"))
-
-    if needs_ogp:
-        from pathlib import Path as _Path
-        if not _Path(ogp_file).exists() or ogp:
-            from .tools.ogp_generator import OgpGenerator
-            gen = OgpGenerator()
-            console.print(f"\n[bold]Generating OGP image ({ogp_theme})...[/bold]")
-            await gen.generate(
-                title=article.title,
-                tags=article.tags,
-                output=ogp_file,
-                author=article.author,
-                theme=ogp_theme,
-            )
-            console.print(f"  [green]Saved:[/green] {ogp_file}")
-        else:
-            console.print(f"\n[dim]OGP image exists:[/dim] {ogp_file}")
-        ogp_path = ogp_file
-
-    if dry_run:
-        console.print("\n[yellow]Dry run mode - no changes will be made[/yellow]")
-        _show_preview(article, target_platforms)
-        return
+    # HTTP client and browser shared by OGP generation and every publisher
+    async with PublishContext() as ctx:
+        # Generate OGP image (auto for note/zenn, or when --ogp flag is set)
+        ogp_path = None
+        ogp_task: asyncio.Task | None = None
+        ogp_file = f"articles/images/{article.slug}-ogp.png"
+        needs_ogp = ogp or not _AUTO_OGP_PLATFORMS.isdisjoint(target_platforms)
+
+        if needs_ogp:
+            # --ogp always regenerates, so only stat the file when it might be reused
+            if ogp or not Path(ogp_file).exists():
+                from .tools.ogp_generator import OgpGenerator
+                gen = OgpGenerator()
+                console.print(f"\n[bold]Generating OGP image ({ogp_theme})...[/bold]")
+
+                async def _generate_ogp() -> None:
+                    await gen.generate(
+                        title=article.title,
+                        tags=article.tags,
+                        output=ogp_file,
+                        author=article.author,
+                        theme=ogp_theme,
+                        browser=await ctx.get_browser(),
+                    )
+                    console.print(f"  [green]Saved:[/green] {ogp_file}")
+
+                # Render in the background; only platforms that attach the image wait for it
+                ogp_task = asyncio.create_task(_generate_ogp())
+            else:
+                console.print(f"\n[dim]OGP image exists:[/dim] {ogp_file}")
+            ogp_path = ogp_file
 
-    # Convert and publish
-    published_urls = {}
+        if dry_run:
+            if ogp_task is not None:
+                await ogp_task
+            console.print("\n[yellow]Dry run mode - no changes will be made[/yellow]")
+            _show_preview(article, target_platforms)
+            return
 
-    with Progress(
-        SpinnerColumn(spinner_name="line"),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        for platform in target_platforms:
-            task = progress.add_task(f"Publishing to {platform}...", total=None)
+        # Convert and publish (platforms are independent, so publish them concurrently)
+        published_urls = {}
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        # One status row per platform, redrawn in place by a single Live region
+        statuses: list = [
+            Spinner("line", text=f"Publishing to {p}...") for p in target_platforms
+        ]
+
+        def _status_table() -> Table:
+            table = Table.grid(padding=(0, 1))
+            for status in statuses:
+                table.add_row(status)
+            return table
+
+        with Live(_status_table(), console=console, refresh_per_second=8) as live:
+
+            def _set_status(index: int, text: str) -> None:
+                statuses[index] = text
+                live.update(_status_table())
+
+            async def _publish_one(index: int, platform: str) -> str | None:
+                try:
+                    result = await _convert_and_publish(
+                        platform, article, ogp_task, ogp_path, semaphore, ctx
+                    )
+                    if result.success:
+                        _set_status(index, f"[green]Published to {platform}[/green]")
+                        return result.url
+                    _set_status(index, f"[red]Failed: {platform} - {result.error}[/red]")
+
+                except Exception as e:
+                    _set_status(index, f"[red]Error: {platform} - {e}[/red]")
+                return None
+
+            urls = await asyncio.gather(
+                *(_publish_one(i, p) for i, p in enumerate(target_platforms))
+            )
 
+        # Make sure the image is finished even if no publisher attached it
+        if ogp_task is not None:
             try:
-                # Convert content
-                converter = ConverterFactory.get_converter(platform)
-                content = converter.convert(article)
-
-                # Publish
-                result = await _publish_to_platform(platform, article, content, ogp_path)
-
-                if result.success:
-                    published_urls[platform] = result.url
-                    progress.update(task, description=f"[green]Published to {platform}[/green]")
-                else:
-                    progress.update(task, description=f"[red]Failed: {platform} - {result.error}[/red]")
-
+                await ogp_task
             except Exception as e:
-                progress.update(task, description=f"[red]Error: {platform} - {e}[/red]")
+                console.print(f"[red]OGP generation failed:[/red] {e}")
+
+    # Keep the requested platform order in the results
+    for platform, url in zip(target_platforms, urls):
+        if url is not None:
+            published_urls[platform] = url
 
     # Show results
     _show_results(published_urls)
 
     # SNS announcements
-    if not no_announce and published_urls:
+    if not no_announce and published_urls and async_announce:
+        from .announcer.queue import AnnouncementQueue, PendingAnnouncement
+
+        # File I/O off the event loop
+        queued = await asyncio.to_thread(
+            AnnouncementQueue().enqueue,
+            PendingAnnouncement(
+                article_path=str(Path(article_path).resolve()),
+                published_urls=published_urls,
+                platforms=list(article.announcement.platforms),
+            ),
+            article.slug,
+        )
+        console.print(f"\n[dim]SNS announcement queued:[/dim] {queued}")
+    elif not no_announce and published_urls:
         console.print("\n[bold]Announcing to SNS...[/bold]")
-        announcement_service = AnnouncementService()
-        results = await announcement_service.announce_all(article, published_urls)
+        async with _announcement_service() as announcement_service:
+            results = await announcement_service.announce_all(
+                article, published_urls, semaphore=semaphore
+            )
 
-        for result in results:
-            if result.success:
-                console.print(f"  [green]OK[/green] {result.platform}: {result.url}")
-            else:
-                console.print(f"  [red]NG[/red] {result.platform}: {result.error}")
+        _show_announce_results(results)
 
 
-async def _publish_to_platform(
-    platform: str, article, content: str, ogp_path: str | None = None
+async def _publish_batch_async(
+    article_paths: list[str],
+    platforms: Optional[list[str]],
+    no_announce: bool,
+    async_announce: bool,
+    ogp_theme: str,
+    max_concurrency: int,
 ):
-    """Publish to a specific platform."""
-    from .publishers.base import PublishResult
+    """Async implementation of publish-batch: every (article, platform) pair in one gather."""
+    from .publishers.context import PublishContext
 
-    if platform == "qiita":
+    articles = []
+    parser = _parser()
+    for path in article_paths:
         try:
-            publisher = QiitaPublisher()
-            return await publisher.publish(article, content)
-        except ValueError as e:
-            return PublishResult.failure_result("qiita", str(e))
-
-    elif platform == "zenn":
-        try:
-            publisher = ZennPublisher()
-            return await publisher.publish(article, content, ogp_path=ogp_path)
+            articles.append((path, parser.parse_file(path)))
         except Exception as e:
-            return PublishResult.failure_result("zenn", str(e))
+            console.print(f"[red]Error parsing {path}:[/red] {e}")
+    if not articles:
+        raise typer.Exit(1)
 
-    elif platform == "note":
-        try:
-            from .publishers.note import NotePublisher
-            publisher = NotePublisher()
-            return await publisher.publish(article, content, ogp_path=ogp_path)
-        except (ImportError, ValueError) as e:
-            return PublishResult.failure_result("note", str(e))
+    override = _split_platforms(platforms) if platforms else None
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async with PublishContext() as ctx:
+
+        async def _publish_article(article) -> dict[str, str]:
+            targets = override or article.get_enabled_platforms()
+
+            ogp_path = None
+            ogp_task: asyncio.Task | None = None
+            if not _AUTO_OGP_PLATFORMS.isdisjoint(targets):
+                ogp_path = f"articles/images/{article.slug}-ogp.png"
+                if not Path(ogp_path).exists():
+                    from .tools.ogp_generator import OgpGenerator
+
+                    async def _generate_ogp() -> None:
+                        async with semaphore:
+                            await OgpGenerator().generate(
+                                title=article.title,
+                                tags=article.tags,
+                                output=ogp_path,
+                                author=article.author,
+                                theme=ogp_theme,
+                                browser=await ctx.get_browser(),
+                            )
+
+                    # As in publish: only the platforms that attach the image wait for it
+                    ogp_task = asyncio.create_task(_generate_ogp())
+
+            async def _publish_one(platform: str) -> str | None:
+                label = f"{article.slug} -> {platform}"
+                try:
+                    result = await _convert_and_publish(
+                        platform, article, ogp_task, ogp_path, semaphore, ctx
+                    )
+                except Exception as e:
+                    console.print(f"[red]Error: {label} - {e}[/red]")
+                    return None
+                if not result.success:
+                    console.print(f"[red]Failed: {label} - {result.error}[/red]")
+                    return None
+                console.print(f"[green]Published {label}[/green]")
+                return result.url
+
+            urls = await asyncio.gather(*(_publish_one(p) for p in targets))
+            if ogp_task is not None:
+                try:
+                    await ogp_task
+                except Exception as e:
+                    console.print(f"[red]OGP generation failed for {article.slug}:[/red] {e}")
+            return {p: url for p, url in zip(targets, urls) if url is not None}
+
+        console.print(f"[bold]Publishing {len(articles)} articles...[/bold]")
+        results = await asyncio.gather(
+            *(_publish_article(article) for _, article in articles), return_exceptions=True
+        )
 
-    elif platform == "blog":
-        try:
-            from .publishers.blog import BlogPublisher
-            publisher = BlogPublisher()
-            return await publisher.publish(article, content, ogp_path=ogp_path)
-        except Exception as e:
-            return PublishResult.failure_result("blog", str(e))
+    published = []
+    for (path, article), urls in zip(articles, results):
+        if isinstance(urls, Exception):
+            console.print(f"[red]Error: {article.slug} - {urls}[/red]")
+            continue
+        console.print(f"\n[bold]{article.title}[/bold]")
+        _show_results(urls)
+        if urls:
+            published.append((path, article, urls))
 
-    else:
+    if no_announce or not published:
+        return
+
+    if async_announce:
+        from .announcer.queue import AnnouncementQueue, PendingAnnouncement
+
+        queue = AnnouncementQueue()
+        for path, article, urls in published:
+            queued = await asyncio.to_thread(
+                queue.enqueue,
+                PendingAnnouncement(
+                    article_path=str(Path(path).resolve()),
+                    published_urls=urls,
+                    platforms=list(article.announcement.platforms),
+                ),
+                article.slug,
+            )
+            console.print(f"[dim]SNS announcement queued:[/dim] {queued}")
+        return
+
+    # Posts to the same SNS platform are still spaced by AnnouncementService.POST_INTERVAL
+    console.print("\n[bold]Announcing to SNS...[/bold]")
+    async with _announcement_service() as service:
+        announced = await asyncio.gather(
+            *(
+                service.announce_all(article, urls, semaphore=semaphore)
+                for _, article, urls in published
+            )
+        )
+    for results in announced:
+        _show_announce_results(results)
+
+
+def _qiita_publisher():
+    from .publishers.qiita import QiitaPublisher
+    return QiitaPublisher
+
+
+def _zenn_publisher():
+    from .publishers.zenn import ZennPublisher
+    return ZennPublisher
+
+
+def _note_publisher():
+    from .publishers.note import NotePublisher
+    return NotePublisher
+
+
+def _blog_publisher():
+    from .publishers.blog import BlogPublisher
+    return BlogPublisher
+
+
+# Platform -> function importing its publisher class (imports stay lazy)
+_PUBLISHERS = {
+    "qiita": _qiita_publisher,
+    "zenn": _zenn_publisher,
+    "note": _note_publisher,
+    "blog": _blog_publisher,
+}
+
+# Publishers that talk HTTP and accept the shared client
+_HTTP_PLATFORMS = frozenset(("qiita", "note"))
+
+
+def _publisher_class(platform: str):
+    """Import and return the publisher class for a platform (None if unknown)."""
+    factory = _PUBLISHERS.get(platform)
+    return factory() if factory is not None else None
+
+
+async def _publish_to_platform(
+    platform: str, article, content: str, ogp_path: str | None = None, ctx=None
+):
+    """Publish to a specific platform.
+
+    ``ctx`` is an optional PublishContext whose HTTP client, browser and locks
+    are shared by the publishers of one run.
+    """
+    from .publishers.base import PublishResult
+
+    factory = _PUBLISHERS.get(platform)
+    if factory is None:
         return PublishResult.failure_result(platform, f"Unknown platform: {platform}")
 
+    kwargs = {}
+    if ctx is not None and platform in _HTTP_PLATFORMS:
+        kwargs["client"] = ctx.http
+    if ctx is not None and platform == "note":
+        # Note logs in with a browser only when its saved session is missing
+        kwargs["get_browser"] = ctx.get_browser
+        kwargs["login_lock"] = ctx.login_lock
+    if ctx is not None and platform == "zenn":
+        kwargs["git_lock"] = ctx.git_lock
+    try:
+        publisher = factory()(**kwargs)
+        return await publisher.publish(article, content, ogp_path=ogp_path)
+    except Exception as e:
+        return PublishResult.failure_result(platform, str(e))
+
+
+async def _convert_and_publish(
+    platform: str,
+    article,
+    ogp_task: asyncio.Task | None,
+    ogp_path: str | None,
+    semaphore: asyncio.Semaphore,
+    ctx,
+):
+    """Convert an article for one platform and publish it.
+
+    Only the platforms that attach the OGP image wait for ``ogp_task``, so a
+    failed image fails those platforms alone.
+    """
+    from .publishers.base import PublishResult
+
+    # Don't convert for a publisher that would reject missing credentials
+    publisher_cls = _publisher_class(platform)
+    if publisher_cls is not None and not publisher_cls.is_configured():
+        return PublishResult.failure_result(platform, "not configured (check .env)")
+
+    # Convert in a worker thread so other platforms' I/O keeps running
+    content = await asyncio.to_thread(_get_converter(platform).convert, article)
+
+    if ogp_task is not None and platform in _OGP_PLATFORMS:
+        await ogp_task
+
+    async with semaphore:
+        return await _publish_to_platform(platform, article, content, ogp_path, ctx)
+
+
+# Platforms that generate an OGP image even without --ogp
+_AUTO_OGP_PLATFORMS = frozenset(("note", "zenn"))
+
+# Platforms whose publishers attach the OGP image
+_OGP_PLATFORMS = frozenset(("zenn", "note", "blog"))
+
+# Number of characters shown per platform in --dry-run previews
+_PREVIEW_CHARS = 500
+
 
 def _show_preview(article, platforms: list[str]):
     """Show preview of converted content."""
@@ -213,10 +554,12 @@ def _show_preview(article, platforms: list[str]):
     for platform in platforms:
         console.print(f"\n[cyan]--- {platform.upper()} ---[/cyan]")
         try:
-            converter = ConverterFactory.get_converter(platform)
-            content = converter.convert(article)
-            # Show first 500 chars
-            preview = content[:500] + "..." if len(content) > 500 else content
+            # Show first 500 chars (one extra tells whether the content was cut)
+            converter = _get_converter(platform)
+            content = converter.convert_prefix(article, _PREVIEW_CHARS + 1)
+            preview = content[:_PREVIEW_CHARS]
+            if len(content) > _PREVIEW_CHARS:
+                preview += "..."
             console.print(preview)
         except Exception as e:
             console.print(f"[red]Error converting: {e}[/red]")
@@ -224,6 +567,8 @@ def _show_preview(article, platforms: list[str]):
 
 def _show_results(published_urls: dict[str, str]):
     """Show publishing results in a table."""
+    from rich.table import Table
+
     if not published_urls:
         console.print("\n[yellow]No articles were published.[/yellow]")
         return
@@ -238,6 +583,27 @@ def _show_results(published_urls: dict[str, str]):
     console.print(table)
 
 
+def _show_announce_results(results) -> None:
+    """Show SNS announcement results in a single table."""
+    from rich.table import Table
+
+    if not results:
+        return
+
+    table = Table(title="\nAnnouncements")
+    table.add_column("Platform", style="cyan")
+    table.add_column("Status")
+    table.add_column("URL / Error")
+
+    for result in results:
+        if result.success:
+            table.add_row(result.platform, "[green]OK[/green]", result.url)
+        else:
+            table.add_row(result.platform, "[red]NG[/red]", result.error)
+
+    console.print(table)
+
+
 @app.command()
 def convert(
     article_path: str = typer.Argument(..., help="Path to the article markdown file"),
@@ -249,7 +615,7 @@ def convert(
     ),
 ):
     """Convert article to platform-specific format."""
-    parser = ArticleParser()
+    parser = _parser()
 
     try:
         article = parser.parse_file(article_path)
@@ -258,7 +624,7 @@ def convert(
         raise typer.Exit(1)
 
     try:
-        converter = ConverterFactory.get_converter(platform)
+        converter = _get_converter(platform)
         content = converter.convert(article)
     except ValueError as e:
         console.print(f"[red]Error:[/red] {e}")
@@ -276,7 +642,7 @@ def validate(
     article_path: str = typer.Argument(..., help="Path to the article markdown file"),
 ):
     """Validate article frontmatter and content."""
-    parser = ArticleParser()
+    parser = _parser()
 
     try:
         article = parser.parse_file(article_path)
@@ -338,17 +704,17 @@ def screenshot(
     ),
 ):
     """Capture screenshot from URL, HTML file, or TSX/JSX component."""
-    import json as json_module
-
     async def _screenshot():
         from .tools.screenshot import ScreenshotTool
 
         # Parse props if provided
         props_dict = None
         if props:
+            from .jsonutil import loads
+
             try:
-                props_dict = json_module.loads(props)
-            except json_module.JSONDecodeError as e:
+                props_dict = loads(props)
+            except json.JSONDecodeError as e:
                 console.print(f"[red]Error parsing props JSON:[/red] {e}")
                 raise typer.Exit(1)
 
@@ -377,31 +743,19 @@ def screenshot(
                 console.print(f"[red]Screenshot failed:[/red] {e}")
                 raise typer.Exit(1)
 
-    asyncio.run(_screenshot())
+    _run(_screenshot())
 
 
-@app.command()
-def init(
-    title: str = typer.Option(..., "--title", "-t", help="Article title"),
-    slug: str = typer.Option(..., "--slug", "-s", help="Article slug"),
-    output_dir: str = typer.Option(
-        "./articles/drafts",
-        "--output", "-o",
-        help="Output directory"
-    ),
-):
-    """Create a new article from template."""
-    from datetime import datetime
-
-    template = f"""---
-title: "{title}"
-slug: "{slug}"
+# Frontmatter and skeleton written by `init`
+_INIT_TEMPLATE = string.Template("""---
+title: "$title"
+slug: "$slug"
 description: ""
 tags: []
 category: "tech"
 author: "tinou"
-created_at: {datetime.now().strftime("%Y-%m-%d")}
-updated_at: {datetime.now().strftime("%Y-%m-%d")}
+created_at: $date
+updated_at: $date
 
 platforms:
   note:
@@ -424,7 +778,7 @@ announcement:
     - misskey
 ---
 
-# {title}
+# $title
 
 Write your article content here.
 
@@ -435,7 +789,24 @@ Write your article content here.
 ## Conclusion
 
 ...
-"""
+""")
+
+
+@app.command()
+def init(
+    title: str = typer.Option(..., "--title", "-t", help="Article title"),
+    slug: str = typer.Option(..., "--slug", "-s", help="Article slug"),
+    output_dir: str = typer.Option(
+        "./articles/drafts",
+        "--output", "-o",
+        help="Output directory"
+    ),
+):
+    """Create a new article from template."""
+    from datetime import datetime
+
+    today = datetime.now().strftime("%Y-%m-%d")
+    template = _INIT_TEMPLATE.substitute(title=title, slug=slug, date=today)
 
     output_path = Path(output_dir) / f"{slug}.md"
     output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -446,23 +817,33 @@ Write your article content here.
 
 @app.command()
 def announce(
-    article_path: str = typer.Argument(..., help="Path to the article markdown file"),
-    platforms: Optional[str] = typer.Option(
+    article_path: Optional[str] = typer.Argument(None, help="Path to the article markdown file"),
+    platforms: Optional[list[str]] = typer.Option(
         None,
         "--platforms", "-p",
-        help="Comma-separated list of platforms (twitter, bluesky, misskey). If not specified, uses frontmatter config."
+        help="Platforms to announce on (twitter, bluesky, misskey); repeat -p or separate with commas. If not specified, uses frontmatter config."
     ),
     urls: Optional[str] = typer.Option(
         None,
         "--urls", "-u",
         help="Published URLs as JSON (e.g., '{\"blog\": \"https://...\"}')"
     ),
+    flush_pending: bool = typer.Option(
+        False,
+        "--flush-pending",
+        help="Post announcements queued by 'publish --async-announce'"
+    ),
 ):
     """Announce an already-published article to SNS."""
-    import json as json_module
+    if flush_pending:
+        _run(_flush_pending_announcements())
+        return
+    if not article_path:
+        console.print("[red]Error:[/red] ARTICLE_PATH is required unless --flush-pending is set")
+        raise typer.Exit(1)
 
     async def _announce():
-        parser = ArticleParser()
+        parser = _parser()
 
         try:
             article = parser.parse_file(article_path)
@@ -475,30 +856,71 @@ def announce(
         # Parse URLs
         published_urls = {}
         if urls:
+            from .jsonutil import loads
+
             try:
-                published_urls = json_module.loads(urls)
-            except json_module.JSONDecodeError as e:
+                published_urls = loads(urls)
+            except json.JSONDecodeError as e:
                 console.print(f"[red]Error parsing URLs JSON:[/red] {e}")
                 raise typer.Exit(1)
 
         # Determine target platforms
         if platforms:
-            target_platforms = [p.strip() for p in platforms.split(",")]
+            target_platforms = _split_platforms(platforms)
             # Override article announcement platforms
             article.announcement.platforms = target_platforms
 
         console.print(f"[bold]Announcing to:[/bold] {', '.join(article.announcement.platforms)}")
 
-        service = AnnouncementService()
-        results = await service.announce_all(article, published_urls)
+        async with _announcement_service() as service:
+            results = await service.announce_all(article, published_urls)
 
-        for result in results:
-            if result.success:
-                console.print(f"  [green]OK[/green] {result.platform}: {result.url}")
-            else:
-                console.print(f"  [red]NG[/red] {result.platform}: {result.error}")
+        _show_announce_results(results)
+
+    _run(_announce())
 
-    asyncio.run(_announce())
+
+async def _flush_pending_announcements():
+    """Post queued announcements; platforms that fail stay queued for the next flush."""
+    from .announcer.queue import AnnouncementQueue
+
+    queue = AnnouncementQueue()
+    pending = queue.pending()
+    if not pending:
+        console.print("[dim]No pending announcements.[/dim]")
+        return
+
+    parser = _parser()
+    async with _announcement_service() as service:
+        for path, item in pending:
+            # One unreadable article must not stop the rest of the flush
+            try:
+                article = parser.parse_file(item.article_path)
+            except FileNotFoundError:
+                console.print(f"[red]Error:[/red] Article not found: {item.article_path}")
+                continue
+            except Exception as e:
+                console.print(f"[red]Error parsing {item.article_path}:[/red] {e}")
+                continue
+
+            console.print(f"\n[bold]Article:[/bold] {article.title}")
+            if not article.announcement.enabled:
+                console.print("[dim]Announcements disabled for this article; dropped.[/dim]")
+                queue.remove(path)
+                continue
+
+            article.announcement.platforms = item.platforms
+            results = await service.announce_all(article, item.published_urls)
+            _show_announce_results(results)
+
+            # Platforms without a result (e.g. announcer unavailable) stay queued too
+            posted = {r.platform for r in results if r.success}
+            remaining = [p for p in item.platforms if p not in posted]
+            if remaining:
+                item.platforms = remaining
+                queue.update(path, item)
+            else:
+                queue.remove(path)
 
 
 @app.command(name="note-login")
@@ -506,24 +928,27 @@ def note_login():
     """Test login to Note and verify session cookies."""
     async def _test():
         try:
+            from .publishers.context import PublishContext
             from .publishers.note import NotePublisher
 
             console.print("[bold]Testing Note login...[/bold]")
 
-            publisher = NotePublisher()
-
-            # First check existing cookies
-            if await publisher.test_login():
-                console.print(f"[green]OK Logged in as {publisher.urlname}[/green]")
-                return
+            # One HTTP client for both session checks
+            async with PublishContext() as ctx:
+                publisher = NotePublisher(client=ctx.http)
 
-            # Try to login via Playwright
-            console.print("[dim]No valid session, logging in via browser...[/dim]")
-            if await publisher._login_and_save_cookies():
+                # First check existing cookies
                 if await publisher.test_login():
-                    console.print(f"[green]OK Login successful! ({publisher.urlname})[/green]")
+                    console.print(f"[green]OK Logged in as {publisher.urlname}[/green]")
                     return
 
+                # Try to login via Playwright
+                console.print("[dim]No valid session, logging in via browser...[/dim]")
+                if await publisher._login_and_save_cookies():
+                    if await publisher.test_login():
+                        console.print(f"[green]OK Login successful! ({publisher.urlname})[/green]")
+                        return
+
             console.print("[red]NG Login failed[/red]")
             console.print("[dim]Check NOTE_EMAIL and NOTE_PASSWORD env vars[/dim]")
             raise typer.Exit(1)
@@ -532,7 +957,7 @@ def note_login():
             console.print(f"[red]Error:[/red] {e}")
             raise typer.Exit(1)
 
-    asyncio.run(_test())
+    _run(_test())
 
 
 @app.command(name="generate-ogp")
@@ -553,7 +978,7 @@ def generate_ogp(
     async def _generate():
         from .tools.ogp_generator import OgpGenerator
 
-        parser = ArticleParser()
+        parser = _parser()
         try:
             article = parser.parse_file(article_path)
         except FileNotFoundError:
@@ -576,7 +1001,7 @@ def generate_ogp(
         )
         console.print(f"[green]Saved:[/green] {result}")
 
-    asyncio.run(_generate())
+    _run(_generate())
 
 
 @app.command(name="test-announce")
@@ -590,17 +1015,21 @@ def test_announce(
 ):
     """Test announcement to a single platform."""
     async def _test():
-        service = AnnouncementService()
+        service = _announcement_service()
 
-        if platform not in service._announcers:
+        announcer = service.get_announcer(platform)
+        if announcer is None:
             console.print(f"[red]Error:[/red] Announcer not available for {platform}")
-            console.print(f"[dim]Available: {', '.join(service._announcers.keys())}[/dim]")
+            console.print(f"[dim]Available: {', '.join(service.available_platforms())}[/dim]")
             raise typer.Exit(1)
 
         console.print(f"[bold]Testing {platform}...[/bold]")
         console.print(f"[dim]Message: {message}[/dim]")
 
-        result = await service._announcers[platform].post(message)
+        try:
+            result = await announcer.post(message)
+        finally:
+            await service.aclose()
 
         if result.success:
             console.print(f"[green]OK Success![/green] {result.url}")
@@ -608,7 +1037,7 @@ def test_announce(
             console.print(f"[red]NG Failed:[/red] {result.error}")
             raise typer.Exit(1)
 
-    asyncio.run(_test())
+    _run(_test())
 
 
 if __name__ == "__main__":
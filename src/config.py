@@ -8,6 +8,8 @@ When adding a new category:
 """
 from __future__ import annotations
 
+import re
+
 # Blog categories - single source of truth
 # Key: category slug, Value: description (for documentation/CLI help)
 BLOG_CATEGORIES: dict[str, str] = {
@@ -42,12 +44,17 @@ CATEGORY_ALIASES: dict[str, str] = {
     "crypto": "security",
 }
 
+# Categories declaration in blog/src/content/config.ts (may span several lines)
+_CATEGORIES_RE = re.compile(r"const categories = \[.*?\] as const;", re.DOTALL)
+
+
+# Valid categories map to themselves and win over any alias of the same name
+_CATEGORY_RESOLVE: dict[str, str] = {**CATEGORY_ALIASES, **{c: c for c in BLOG_CATEGORIES}}
+
 
 def resolve_category(category: str) -> str:
     """Resolve a category string to a valid blog category."""
-    if category in BLOG_CATEGORIES:
-        return category
-    return CATEGORY_ALIASES.get(category, DEFAULT_CATEGORY)
+    return _CATEGORY_RESOLVE.get(category, DEFAULT_CATEGORY)
 
 
 def sync_blog_config() -> None:
@@ -65,12 +72,7 @@ def sync_blog_config() -> None:
     categories_str = ", ".join(f"'{c}'" for c in BLOG_CATEGORIES)
     new_line = f"const categories = [{categories_str}] as const;"
 
-    import re
-    updated = re.sub(
-        r"const categories = \[.*?\] as const;",
-        new_line,
-        content,
-    )
+    updated = _CATEGORIES_RE.sub(new_line, content)
 
     if updated != content:
         config_path.write_text(updated, encoding="utf-8")
@@ -0,0 +1,24 @@
+"""Filesystem helpers shared by the publishers and the announcement queue."""
+from __future__ import annotations
+
+import os
+import tempfile
+from pathlib import Path
+
+
+def write_atomic(path: Path, content: str) -> None:
+    """Write text to a temp file next to ``path`` and rename it into place.
+
+    Readers (Astro's file watcher, the next queue flush) never see a
+    half-written file, even if the process is interrupted mid-write.
+    """
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(content)
+        # mkstemp creates the file as 0600; these are normal readable files
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
@@ -0,0 +1,37 @@
+"""JSON helpers shared by the CLI, publishers and announcers.
+
+orjson is used when installed (pip install article-publisher[fast]);
+the standard library produces the same compact UTF-8 output otherwise.
+"""
+from __future__ import annotations
+
+import json
+from typing import Any
+
+# orjson is optional - faster parsing/serialization of (Japanese) payloads
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes.
+
+    Non-ASCII text is written as-is rather than as \\uXXXX escapes, which
+    roughly halves the size of Japanese payloads.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse JSON text or bytes.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch the latter.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
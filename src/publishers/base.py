@@ -2,13 +2,16 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from datetime import datetime
+from typing import Any
 
 from ..transformer.article import Article
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PublishResult:
     """Result of a publish operation."""
 
@@ -41,6 +44,31 @@ class Publisher(ABC):
 
     platform_name: str = "base"
 
+    # (Article attribute, error message) pairs checked by validate(); extend in subclasses
+    _REQUIRED_FIELDS: tuple[tuple[str, str], ...] = (
+        ("title", "Title is required"),
+        ("content", "Content is required"),
+    )
+
+    # Shared httpx.AsyncClient injected by the caller (see PublishContext)
+    _client: Any = None
+
+    @asynccontextmanager
+    async def _http(self) -> AsyncIterator[Any]:
+        """Yield the shared HTTP client, or a short-lived one if none was injected."""
+        if self._client is not None:
+            yield self._client
+            return
+        from .context import new_http_client
+
+        async with new_http_client() as client:
+            yield client
+
+    @classmethod
+    def is_configured(cls) -> bool:
+        """Cheap check that the credentials/settings needed to publish are present."""
+        return True
+
     @abstractmethod
     async def publish(self, article: Article, content: str) -> PublishResult:
         """Publish article content to the platform.
@@ -85,9 +113,4 @@ class Publisher(ABC):
 
         Returns list of validation errors (empty if valid).
         """
-        errors = []
-        if not article.title:
-            errors.append("Title is required")
-        if not article.content:
-            errors.append("Content is required")
-        return errors
+        return [msg for attr, msg in self._REQUIRED_FIELDS if not getattr(article, attr)]
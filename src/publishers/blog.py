@@ -1,14 +1,65 @@
 """Blog publisher using Astro content directory."""
 from __future__ import annotations
 
+import asyncio
 import os
 import shutil
+import tempfile
 from pathlib import Path
 
+from ..fsutil import write_atomic
 from ..transformer.article import Article
 from .base import Publisher, PublishResult
 
 
+def _copy_into(src_file, dst_fd: int) -> None:
+    """Copy an open binary file into ``dst_fd``, inside the kernel where possible.
+
+    copy_file_range (Linux) avoids copying through user space and can share
+    extents on reflink filesystems; elsewhere shutil copies in chunks.
+    """
+    src_fd = src_file.fileno()
+    if hasattr(os, "copy_file_range"):
+        remaining = os.fstat(src_fd).st_size
+        try:
+            while remaining > 0:
+                copied = os.copy_file_range(src_fd, dst_fd, remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+            if remaining == 0:
+                return
+        except OSError:
+            pass  # e.g. cross-device on older kernels: start over below
+        os.lseek(src_fd, 0, os.SEEK_SET)
+        os.lseek(dst_fd, 0, os.SEEK_SET)
+        os.ftruncate(dst_fd, 0)
+    with open(dst_fd, "wb", closefd=False) as dst_file:
+        shutil.copyfileobj(src_file, dst_file)
+
+
+def _copy_atomic(src: str | Path, dest: Path) -> None:
+    """Copy a file to a temp name next to ``dest`` and rename it into place.
+
+    Only the content and timestamps are copied (these are public assets, so
+    the mode is always 0644).
+    """
+    fd, tmp = tempfile.mkstemp(dir=dest.parent, prefix=f".{dest.name}.", suffix=".tmp")
+    try:
+        try:
+            with open(src, "rb") as src_file:
+                _copy_into(src_file, fd)
+                st = os.fstat(src_file.fileno())
+        finally:
+            os.close(fd)
+        os.utime(tmp, ns=(st.st_atime_ns, st.st_mtime_ns))
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, dest)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
 class BlogPublisher(Publisher):
     """Publisher for Astro blog.
 
@@ -26,27 +77,19 @@ class BlogPublisher(Publisher):
         )
         self.articles_path = self.blog_path / "src" / "content" / "articles"
         self.images_path = self.blog_path / "public" / "images"
+        self._url_prefix = f"{self.BLOG_BASE_URL}/articles/"
 
     async def publish(
         self, article: Article, content: str, ogp_path: str | None = None
     ) -> PublishResult:
         """Publish article by writing to Astro blog content directory."""
         try:
-            self.articles_path.mkdir(parents=True, exist_ok=True)
-
-            article_file = self.articles_path / f"{article.slug}.md"
-            article_file.write_text(content, encoding="utf-8")
+            # Blocking file I/O runs in a worker thread so concurrent publishes keep going
+            await asyncio.to_thread(self._write_files, article, content, ogp_path)
 
-            # Copy OGP image to public/images/
-            if ogp_path and Path(ogp_path).exists():
-                self.images_path.mkdir(parents=True, exist_ok=True)
-                dest = self.images_path / f"{article.slug}-ogp.png"
-                shutil.copy2(ogp_path, dest)
-
-            url = f"{self.BLOG_BASE_URL}/articles/{article.slug}"
             return PublishResult.success_result(
                 platform=self.platform_name,
-                url=url,
+                url=self._url_prefix + article.slug,
             )
 
         except Exception as e:
@@ -55,6 +98,15 @@ class BlogPublisher(Publisher):
                 error=str(e),
             )
 
+    def _write_files(self, article: Article, content: str, ogp_path: str | None) -> None:
+        """Write the article file and copy its OGP image to public/images/."""
+        self.articles_path.mkdir(parents=True, exist_ok=True)
+        write_atomic(self.articles_path / f"{article.slug}.md", content)
+
+        if ogp_path and Path(ogp_path).exists():
+            self.images_path.mkdir(parents=True, exist_ok=True)
+            _copy_atomic(ogp_path, self.images_path / f"{article.slug}-ogp.png")
+
     async def update(self, article: Article, content: str, article_id: str) -> PublishResult:
         """Update existing blog article."""
         return await self.publish(article, content)
@@ -0,0 +1,91 @@
+"""Shared resources for one publish run."""
+from __future__ import annotations
+
+import asyncio
+import os
+from typing import Any
+
+import httpx
+
+# Playwright is optional - only needed for OGP generation and Note login
+try:
+    from playwright.async_api import async_playwright
+    PLAYWRIGHT_AVAILABLE = True
+except ImportError:
+    PLAYWRIGHT_AVAILABLE = False
+
+# Connection attempts per request; httpx retries only connect errors/timeouts,
+# so a request that reached the server is never sent twice
+HTTP_CONNECT_RETRIES = 3
+
+
+def new_http_client() -> httpx.AsyncClient:
+    """Create the HTTP client used by publishers, with connection retries."""
+    return httpx.AsyncClient(
+        transport=httpx.AsyncHTTPTransport(retries=HTTP_CONNECT_RETRIES)
+    )
+
+
+class PublishContext:
+    """Long-lived HTTP client and browser shared by the publishers of one run.
+
+    Use as ``async with PublishContext() as ctx:``. The HTTP client keeps
+    connections alive across platforms, and the Chromium browser is launched
+    at most once, on first use. When NOTE_CDP_ENDPOINT is set, the context
+    attaches to that already-running Chromium instead of launching one.
+    """
+
+    def __init__(self):
+        self.http = new_http_client()
+        self._playwright: Any = None
+        self._browser: Any = None
+        # False when attached over CDP: that browser belongs to someone else
+        self._owns_browser = False
+        self._browser_lock = asyncio.Lock()
+        # Serializes git commands in the zenn-content repository across publishers
+        self.git_lock = asyncio.Lock()
+        # Serializes Note browser logins across publishers
+        self.login_lock = asyncio.Lock()
+
+    async def __aenter__(self) -> PublishContext:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def get_browser(self) -> Any:
+        """Return the shared Chromium browser, launching or attaching on first call."""
+        if not PLAYWRIGHT_AVAILABLE:
+            raise ImportError(
+                "Playwright is required. "
+                "Install with: pip install playwright && playwright install chromium"
+            )
+        # Concurrent callers must not launch a second browser
+        async with self._browser_lock:
+            if self._browser is None:
+                self._playwright = await async_playwright().start()
+                cdp_endpoint = os.getenv("NOTE_CDP_ENDPOINT")
+                if cdp_endpoint:
+                    self._browser = await self._playwright.chromium.connect_over_cdp(
+                        cdp_endpoint
+                    )
+                    self._owns_browser = False
+                else:
+                    self._browser = await self._playwright.chromium.launch()
+                    self._owns_browser = True
+        return self._browser
+
+    async def aclose(self) -> None:
+        """Close the HTTP client and the browser if this context launched it.
+
+        A browser attached over CDP is left running; stopping Playwright
+        below only drops the connection to it.
+        """
+        await self.http.aclose()
+        if self._browser is not None:
+            if self._owns_browser:
+                await self._browser.close()
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
@@ -14,24 +14,92 @@ Playwright is only used for initial login to obtain the session cookie.
 from __future__ import annotations
 
 import asyncio
-import json
+import io
+import itertools
 import os
 import re
-import uuid
+from collections.abc import Awaitable, Callable, Iterator
 from pathlib import Path
+from typing import Any
 
 import httpx
 
+from ..jsonutil import dumps_bytes, loads
 from ..transformer.article import Article
 from .base import Publisher, PublishResult
 
 # Playwright is optional - only needed for login
 try:
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError
     from playwright.async_api import async_playwright
     PLAYWRIGHT_AVAILABLE = True
 except ImportError:
     PLAYWRIGHT_AVAILABLE = False
 
+# Cookie file path -> (mtime_ns, parsed cookies)
+_COOKIE_CACHE: dict[Path, tuple[int, dict[str, str]]] = {}
+
+# Resource types not needed to fill in and submit the login form
+_BLOCKED_RESOURCE_TYPES = frozenset(("image", "font", "media"))
+
+
+async def _abort_heavy_resources(route: Any) -> None:
+    """Playwright route handler that drops images, fonts and media."""
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+# Markdown patterns used by NoteHtmlConverter, compiled once per process
+_RE_HEADING = re.compile(r"^(#{1,6})\s+(.+)$")
+_RE_HR = re.compile(r"^(-{3,}|\*{3,}|_{3,})$")
+_RE_IMAGE = re.compile(r"^!\[([^\]]*)\]\(([^)]+)\)$")
+# List items capture their text after the marker
+_RE_UL_ITEM = re.compile(r"[-*+]\s+(.*)")
+_RE_OL_ITEM = re.compile(r"\d+\.\s+(.*)")
+_RE_TABLE_SEPARATOR = re.compile(r"^[-:]+$")
+_RE_BOLD = re.compile(r"\*\*(.+?)\*\*")
+_RE_ITALIC = re.compile(r"\*(.+?)\*")
+_RE_LINK = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
+# Any line that ends a paragraph: fence, heading, image, list item, quote,
+# table row, horizontal rule or blank line (the last three may be indented)
+_RE_PARAGRAPH_END = re.compile(
+    r"```|#{1,6}\s|!\[|[-*+]\s|\d+\.\s|> |\s*\||\s*(?:-{3,}|\*{3,}|_{3,})?\s*$"
+)
+
+# Block type of a line, in the order convert() used to test them; the name
+# of the matching group is the type (headings and images need their text)
+_RE_BLOCK = re.compile(
+    r"(?P<fence>```)"
+    r"|(?P<heading>#{1,6}\s.)"
+    r"|(?P<hr>\s*(?:-{3,}|\*{3,}|_{3,})\s*$)"
+    r"|(?P<blank>\s*$)"
+    r"|(?P<table>\s*\|)"
+    r"|(?P<image>\s*!\[[^\]]*\]\([^)]+\)\s*$)"
+    r"|(?P<ul>[-*+]\s)"
+    r"|(?P<ol>\d+\.\s)"
+    r"|(?P<quote>> )"
+)
+
+# Single-pass escaping tables for text and attribute values
+_HTML_ESCAPE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+_ATTR_ESCAPE = str.maketrans({"&": "&amp;", '"': "&quot;", "<": "&lt;", ">": "&gt;"})
+
+
+def _block_ids() -> Iterator[str]:
+    """Yield unique UUID-shaped ids for the blocks of one document.
+
+    Note only needs the name/id attributes to be unique, so a single
+    os.urandom call seeds a random v4-style prefix and a counter instead
+    of generating a full UUID per block.
+    """
+    h = os.urandom(16).hex()
+    variant = "89ab"[int(h[16], 16) & 3]
+    prefix = f"{h[0:8]}-{h[8:12]}-4{h[13:16]}-{variant}{h[17:20]}-"
+    for n in itertools.count(int(h[20:32], 16)):
+        yield f"{prefix}{n & 0xFFFFFFFFFFFF:012x}"
+
 
 class NoteHtmlConverter:
     """Convert Markdown to Note-compatible HTML.
@@ -57,15 +125,19 @@ class NoteHtmlConverter:
             Tuple of (html_body, body_length)
         """
         lines = markdown.split("\n")
-        html_parts = []
+        buf = io.StringIO()
+        ids = _block_ids()
         text_length = 0
         i = 0
 
         while i < len(lines):
             line = lines[i]
+            # Classify the line once; anything unmatched is paragraph text
+            m = _RE_BLOCK.match(line)
+            kind = m.lastgroup if m else "para"
 
             # Code block → <pre><code>
-            if line.startswith("```"):
+            if kind == "fence":
                 code_lines = []
                 i += 1
                 while i < len(lines) and not lines[i].startswith("```"):
@@ -73,135 +145,128 @@ class NoteHtmlConverter:
                     i += 1
                 i += 1  # skip closing ```
                 code_text = "\n".join(code_lines)
-                p_id = str(uuid.uuid4())
-                html_parts.append(
+                p_id = next(ids)
+                buf.write(
                     f'<pre name="{p_id}" id="{p_id}">'
                     f'<code>{self._escape_html(code_text)}</code></pre>'
                 )
                 text_length += len(code_text)
-                continue
 
             # Heading
-            heading_match = re.match(r"^(#{1,6})\s+(.+)$", line)
-            if heading_match:
+            elif kind == "heading":
+                heading_match = _RE_HEADING.match(line)
                 level = len(heading_match.group(1))
                 text = heading_match.group(2)
-                p_id = str(uuid.uuid4())
-                html_parts.append(
+                p_id = next(ids)
+                buf.write(
                     f'<h{level} name="{p_id}" id="{p_id}">{self._inline(text)}</h{level}>'
                 )
                 text_length += len(text)
                 i += 1
-                continue
 
             # Horizontal rule
-            if re.match(r"^(-{3,}|\*{3,}|_{3,})$", line.strip()):
-                html_parts.append("<hr>")
+            elif kind == "hr":
+                buf.write("<hr>")
                 i += 1
-                continue
 
             # Empty line → spacing paragraph
-            if not line.strip():
-                p_id = str(uuid.uuid4())
-                html_parts.append(f'<p name="{p_id}" id="{p_id}"><br></p>')
+            elif kind == "blank":
+                p_id = next(ids)
+                buf.write(f'<p name="{p_id}" id="{p_id}"><br></p>')
                 i += 1
-                continue
 
             # Table → text paragraphs with bold headers
-            if line.strip().startswith("|") and "|" in line:
+            elif kind == "table":
                 table_lines = []
-                while i < len(lines) and lines[i].strip().startswith("|"):
+                while i < len(lines) and lines[i].lstrip().startswith("|"):
                     table_lines.append(lines[i])
                     i += 1
-                self._convert_table(table_lines, html_parts)
-                text_length += sum(len(tl) for tl in table_lines)
-                continue
+                self._convert_table(table_lines, buf, ids)
+                text_length += sum(map(len, table_lines))
 
             # Image
-            img_match = re.match(r"^!\[([^\]]*)\]\(([^)]+)\)$", line.strip())
-            if img_match:
+            elif kind == "image":
+                img_match = _RE_IMAGE.match(line.strip())
                 alt = img_match.group(1)
                 src = img_match.group(2)
-                p_id = str(uuid.uuid4())
-                html_parts.append(
+                p_id = next(ids)
+                buf.write(
                     f'<figure name="{p_id}" id="{p_id}">'
                     f'<img src="{self._escape_attr(src)}" alt="{self._escape_attr(alt)}">'
                     f'</figure>'
                 )
                 i += 1
-                continue
 
             # Unordered list
-            if re.match(r"^[-*+]\s", line):
+            elif kind == "ul":
                 list_items = []
-                while i < len(lines) and re.match(r"^[-*+]\s", lines[i]):
-                    item_text = re.sub(r"^[-*+]\s+", "", lines[i])
-                    list_items.append(item_text)
+                while i < len(lines) and (item := _RE_UL_ITEM.match(lines[i])):
+                    list_items.append(item.group(1))
                     i += 1
-                p_id = str(uuid.uuid4())
+                p_id = next(ids)
                 items_html = "".join(
-                    f"<li>{self._inline(item)}</li>" for item in list_items
+                    [f"<li>{self._inline(item)}</li>" for item in list_items]
                 )
-                html_parts.append(
+                buf.write(
                     f'<ul name="{p_id}" id="{p_id}">{items_html}</ul>'
                 )
-                text_length += sum(len(item) for item in list_items)
-                continue
+                text_length += sum(map(len, list_items))
 
             # Ordered list
-            if re.match(r"^\d+\.\s", line):
+            elif kind == "ol":
                 list_items = []
-                while i < len(lines) and re.match(r"^\d+\.\s", lines[i]):
-                    item_text = re.sub(r"^\d+\.\s+", "", lines[i])
-                    list_items.append(item_text)
+                while i < len(lines) and (item := _RE_OL_ITEM.match(lines[i])):
+                    list_items.append(item.group(1))
                     i += 1
-                p_id = str(uuid.uuid4())
+                p_id = next(ids)
                 items_html = "".join(
-                    f"<li>{self._inline(item)}</li>" for item in list_items
+                    [f"<li>{self._inline(item)}</li>" for item in list_items]
                 )
-                html_parts.append(
+                buf.write(
                     f'<ol name="{p_id}" id="{p_id}">{items_html}</ol>'
                 )
-                text_length += sum(len(item) for item in list_items)
-                continue
+                text_length += sum(map(len, list_items))
 
             # Blockquote
-            if line.startswith("> "):
+            elif kind == "quote":
                 quote_lines = []
                 while i < len(lines) and lines[i].startswith("> "):
                     quote_lines.append(lines[i][2:])
                     i += 1
-                p_id = str(uuid.uuid4())
-                quote_text = "<br>".join(self._inline(ql) for ql in quote_lines)
-                html_parts.append(
+                p_id = next(ids)
+                quote_text = "<br>".join(map(self._inline, quote_lines))
+                buf.write(
                     f'<blockquote name="{p_id}" id="{p_id}">'
                     f'<p>{quote_text}</p></blockquote>'
                 )
-                text_length += sum(len(ql) for ql in quote_lines)
-                continue
+                text_length += sum(map(len, quote_lines))
 
-            # Regular paragraph (may span multiple lines)
-            para_lines = []
-            while i < len(lines) and lines[i].strip() and not self._is_block_start(lines[i]):
-                para_lines.append(lines[i])
+            # Regular paragraph (may span multiple lines). The first line is
+            # always taken so that e.g. "# " or "![broken" cannot stall the loop.
+            else:
+                para_lines = [line]
                 i += 1
-            if para_lines:
-                p_id = str(uuid.uuid4())
-                para_text = "<br>".join(self._inline(pl) for pl in para_lines)
-                html_parts.append(
+                while i < len(lines) and not self._ends_paragraph(lines[i]):
+                    para_lines.append(lines[i])
+                    i += 1
+                p_id = next(ids)
+                para_text = "<br>".join(map(self._inline, para_lines))
+                buf.write(
                     f'<p name="{p_id}" id="{p_id}">{para_text}</p>'
                 )
-                text_length += sum(len(pl) for pl in para_lines)
+                text_length += sum(map(len, para_lines))
 
-        return "".join(html_parts), text_length
+        return buf.getvalue(), text_length
 
-    def _convert_table(self, table_lines: list[str], html_parts: list[str]):
+    def _convert_table(
+        self, table_lines: list[str], buf: io.StringIO, ids: Iterator[str]
+    ):
         """Convert markdown table to text paragraphs (Note doesn't support HTML tables)."""
         rows = []
         for line in table_lines:
             cells = [c.strip() for c in line.strip().strip("|").split("|")]
             # Skip separator row (---|---|---)
-            if cells and all(re.match(r"^[-:]+$", c) for c in cells):
+            if cells and all(_RE_TABLE_SEPARATOR.match(c) for c in cells):
                 continue
             rows.append(cells)
 
@@ -212,35 +277,19 @@ class NoteHtmlConverter:
         data_rows = rows[1:]
 
         # Header row: bold text with | separator
-        p_id = str(uuid.uuid4())
-        header_text = " | ".join(f"<strong>{self._inline(h)}</strong>" for h in headers)
-        html_parts.append(f'<p name="{p_id}" id="{p_id}">{header_text}</p>')
+        p_id = next(ids)
+        header_text = " | ".join([f"<strong>{self._inline(h)}</strong>" for h in headers])
+        buf.write(f'<p name="{p_id}" id="{p_id}">{header_text}</p>')
 
         # Data rows
         for row in data_rows:
-            p_id = str(uuid.uuid4())
-            row_text = " | ".join(self._inline(c) for c in row)
-            html_parts.append(f'<p name="{p_id}" id="{p_id}">{row_text}</p>')
+            p_id = next(ids)
+            row_text = " | ".join(map(self._inline, row))
+            buf.write(f'<p name="{p_id}" id="{p_id}">{row_text}</p>')
 
-    def _is_block_start(self, line: str) -> bool:
-        """Check if a line starts a block element."""
-        if line.startswith("```"):
-            return True
-        if re.match(r"^#{1,6}\s", line):
-            return True
-        if re.match(r"^(-{3,}|\*{3,}|_{3,})$", line.strip()):
-            return True
-        if re.match(r"^!\[", line):
-            return True
-        if re.match(r"^[-*+]\s", line):
-            return True
-        if re.match(r"^\d+\.\s", line):
-            return True
-        if line.startswith("> "):
-            return True
-        if line.strip().startswith("|") and "|" in line:
-            return True
-        return False
+    def _ends_paragraph(self, line: str) -> bool:
+        """Check if a line is blank or starts a block element."""
+        return _RE_PARAGRAPH_END.match(line) is not None
 
     def _inline(self, text: str) -> str:
         """Convert inline markdown to Note-compatible HTML.
@@ -248,36 +297,30 @@ class NoteHtmlConverter:
         Note's ProseMirror only supports <strong> for inline formatting.
         <code>, <em>, <i>, <mark> are all stripped by the editor.
         """
-        # Bold (must be before italic to avoid conflict)
-        text = re.sub(r"\*\*(.+?)\*\*", r"<strong>\1</strong>", text)
-        # Italic → plain text (Note doesn't support <em>)
-        text = re.sub(r"\*(.+?)\*", r"\1", text)
+        # Most lines have no markup: a substring test is far cheaper than a regex pass
+        if "*" in text:
+            # Bold (must be before italic to avoid conflict)
+            text = _RE_BOLD.sub(r"<strong>\1</strong>", text)
+            # Italic → plain text (Note doesn't support <em>)
+            text = _RE_ITALIC.sub(r"\1", text)
         # Inline code → keep backtick characters (Note doesn't support <code> inline)
         # No transformation needed - backticks stay as-is
         # Links
-        text = re.sub(
-            r"\[([^\]]+)\]\(([^)]+)\)",
-            r'<a href="\2">\1</a>',
-            text,
-        )
+        if "](" in text:
+            text = _RE_LINK.sub(r'<a href="\2">\1</a>', text)
         return text
 
     def _escape_html(self, text: str) -> str:
         """Escape HTML special characters."""
-        return (
-            text.replace("&", "&amp;")
-            .replace("<", "&lt;")
-            .replace(">", "&gt;")
-        )
+        return text.translate(_HTML_ESCAPE)
 
     def _escape_attr(self, text: str) -> str:
         """Escape HTML attribute value."""
-        return (
-            text.replace("&", "&amp;")
-            .replace('"', "&quot;")
-            .replace("<", "&lt;")
-            .replace(">", "&gt;")
-        )
+        return text.translate(_ATTR_ESCAPE)
+
+
+# The converter is stateless, so every publisher shares one instance
+_HTML_CONVERTER = NoteHtmlConverter()
 
 
 class NotePublisher(Publisher):
@@ -296,29 +339,72 @@ class NotePublisher(Publisher):
         password: str | None = None,
         cookies_path: str | None = None,
         urlname: str | None = None,
+        client: httpx.AsyncClient | None = None,
+        get_browser: Callable[[], Awaitable[Any]] | None = None,
+        login_lock: asyncio.Lock | None = None,
     ):
+        self._client = client
+        # Only one browser login at a time; the others reuse the cookies it saves.
+        # Publishers of one run share the lock through PublishContext.login_lock
+        self._login_lock = login_lock or asyncio.Lock()
+        # Returns a shared, already-launched Playwright browser (e.g. PublishContext.get_browser)
+        self._get_browser = get_browser
         self.email = email or os.getenv("NOTE_EMAIL")
         self.password = password or os.getenv("NOTE_PASSWORD")
         self.cookies_path = Path(
             cookies_path or os.getenv("NOTE_COOKIES_PATH", "./.note_cookies.json")
         )
         self.urlname = urlname or os.getenv("NOTE_URLNAME", "")
-        self.html_converter = NoteHtmlConverter()
+        self.html_converter = _HTML_CONVERTER
+        # (cookies, headers) of the last _get_headers call
+        self._headers_cache: tuple[dict[str, str], dict[str, str]] | None = None
+
+    @classmethod
+    def is_configured(cls) -> bool:
+        """Saved session cookies, or credentials to log in with, are available."""
+        if Path(os.getenv("NOTE_COOKIES_PATH", "./.note_cookies.json")).exists():
+            return True
+        return bool(os.getenv("NOTE_EMAIL") and os.getenv("NOTE_PASSWORD"))
+
+    async def _load_cookies(self) -> dict[str, str] | None:
+        """Load session cookies without blocking the event loop on file I/O."""
+        return await asyncio.to_thread(self._read_cookies)
 
-    def _load_cookies(self) -> dict[str, str] | None:
-        """Load session cookies from file."""
-        if not self.cookies_path.exists():
+    def _read_cookies(self) -> dict[str, str] | None:
+        """Load session cookies from file.
+
+        The parsed cookies are cached per file and re-read only when its
+        modification time changes (e.g. after a login rewrote it).
+        """
+        try:
+            mtime = self.cookies_path.stat().st_mtime_ns
+        except OSError:
             return None
+        cached = _COOKIE_CACHE.get(self.cookies_path)
+        if cached is not None and cached[0] == mtime:
+            return dict(cached[1])
         try:
-            cookies_list = json.loads(self.cookies_path.read_text())
-            return {c["name"]: c["value"] for c in cookies_list}
+            raw = self.cookies_path.read_bytes()
+            data = loads(raw)
+            # Playwright storage_state ({"cookies": [...], "origins": [...]}) or a bare cookie list
+            cookies_list = data["cookies"] if isinstance(data, dict) else data
+            cookies = {c["name"]: c["value"] for c in cookies_list}
         except Exception:
             return None
+        _COOKIE_CACHE[self.cookies_path] = (mtime, cookies)
+        return dict(cookies)
 
     def _get_headers(self, cookies: dict[str, str]) -> dict[str, str]:
-        """Build request headers with session cookie."""
+        """Build request headers with session cookie.
+
+        The result is reused until the cookies change (e.g. after a re-login),
+        so callers must not modify it.
+        """
+        cached = self._headers_cache
+        if cached is not None and cached[0] == cookies:
+            return cached[1]
         cookie_header = "; ".join(f"{k}={v}" for k, v in cookies.items())
-        return {
+        headers = {
             "Accept": "application/json",
             "Content-Type": "application/json",
             "User-Agent": (
@@ -331,21 +417,24 @@ class NotePublisher(Publisher):
             "X-Requested-With": "XMLHttpRequest",
             "Cookie": cookie_header,
         }
+        self._headers_cache = (cookies, headers)
+        return headers
 
-    async def _ensure_urlname(self, headers: dict[str, str]) -> str:
-        """Get urlname from API if not set."""
+    async def _ensure_urlname(
+        self, client: httpx.AsyncClient, headers: dict[str, str]
+    ) -> str:
+        """Get urlname from API if not set, on the caller's connection pool."""
         if self.urlname:
             return self.urlname
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(
-                f"{self.BASE_URL}/api/v2/current_user",
-                headers=headers,
-                timeout=15.0,
-            )
-            if resp.status_code == 200:
-                data = resp.json().get("data", {})
-                self.urlname = data.get("urlname", "")
-                return self.urlname
+        resp = await client.get(
+            f"{self.BASE_URL}/api/v2/current_user",
+            headers=headers,
+            timeout=15.0,
+        )
+        if resp.status_code == 200:
+            data = resp.json().get("data", {})
+            self.urlname = data.get("urlname", "")
+            return self.urlname
         return ""
 
     async def publish(
@@ -359,14 +448,18 @@ class NotePublisher(Publisher):
         3. Convert markdown to Note HTML
         4. Save content via POST /api/v1/text_notes/draft_save
         """
-        cookies = self._load_cookies()
+        cookies = await self._load_cookies()
         if not cookies or "_note_session_v5" not in cookies:
-            if not await self._login_and_save_cookies():
-                return PublishResult.failure_result(
-                    platform=self.platform_name,
-                    error="Not logged in. Run 'publisher note-login' first.",
-                )
-            cookies = self._load_cookies()
+            # Concurrent publishes (publish-batch) share a single browser login
+            async with self._login_lock:
+                cookies = await self._load_cookies()
+                if not cookies or "_note_session_v5" not in cookies:
+                    if not await self._login_and_save_cookies():
+                        return PublishResult.failure_result(
+                            platform=self.platform_name,
+                            error="Not logged in. Run 'publisher note-login' first.",
+                        )
+                    cookies = await self._load_cookies()
             if not cookies:
                 return PublishResult.failure_result(
                     platform=self.platform_name,
@@ -376,14 +469,16 @@ class NotePublisher(Publisher):
         headers = self._get_headers(cookies)
 
         try:
-            async with httpx.AsyncClient() as client:
+            async with self._http() as client:
                 # Step 1: Create blank draft
-                resp = await client.post(
-                    f"{self.BASE_URL}/api/v1/text_notes",
-                    headers=headers,
-                    json={"template_key": None},
-                    timeout=15.0,
-                )
+                resp = await self._create_draft(client, headers)
+                if resp.status_code in (401, 403):
+                    # The saved session expired: log in again once and retry
+                    fresh = await self._relogin(cookies)
+                    if fresh:
+                        cookies = fresh
+                        headers = self._get_headers(cookies)
+                        resp = await self._create_draft(client, headers)
 
                 if resp.status_code != 201:
                     return PublishResult.failure_result(
@@ -411,16 +506,19 @@ class NotePublisher(Publisher):
                     "is_lead_form": False,
                 }
 
-                resp = await client.post(
-                    f"{self.BASE_URL}/api/v1/text_notes/draft_save"
-                    f"?id={note_id}&is_temp_saved=true",
-                    headers=headers,
-                    json=save_payload,
-                    timeout=30.0,
+                # The urlname lookup (needed for the draft URL) overlaps the save
+                resp, urlname = await asyncio.gather(
+                    client.post(
+                        f"{self.BASE_URL}/api/v1/text_notes/draft_save"
+                        f"?id={note_id}&is_temp_saved=true",
+                        headers=headers,
+                        content=dumps_bytes(save_payload),
+                        timeout=30.0,
+                    ),
+                    self._ensure_urlname(client, headers),
                 )
 
                 if resp.status_code == 201:
-                    urlname = await self._ensure_urlname(headers)
                     draft_url = f"{self.BASE_URL}/{urlname}/n/{note_key}"
                     return PublishResult.success_result(
                         platform=self.platform_name,
@@ -438,6 +536,31 @@ class NotePublisher(Publisher):
                 error=f"Request failed: {str(e)}",
             )
 
+    async def _create_draft(
+        self, client: httpx.AsyncClient, headers: dict[str, str]
+    ) -> httpx.Response:
+        """Create a blank draft (POST /api/v1/text_notes)."""
+        return await client.post(
+            f"{self.BASE_URL}/api/v1/text_notes",
+            headers=headers,
+            json={"template_key": None},
+            timeout=15.0,
+        )
+
+    async def _relogin(self, stale: dict[str, str]) -> dict[str, str] | None:
+        """Replace a rejected session; returns the new cookies or None.
+
+        If a concurrent publish already saved a different session, that one is
+        reused instead of logging in again.
+        """
+        async with self._login_lock:
+            cookies = await self._load_cookies()
+            if cookies and cookies != stale:
+                return cookies
+            if not await self._login_and_save_cookies():
+                return None
+            return await self._load_cookies()
+
     async def _upload_eyecatch(
         self,
         client: httpx.AsyncClient,
@@ -494,7 +617,7 @@ class NotePublisher(Publisher):
 
         article_id should be the note numeric ID.
         """
-        cookies = self._load_cookies()
+        cookies = await self._load_cookies()
         if not cookies or "_note_session_v5" not in cookies:
             return PublishResult.failure_result(
                 platform=self.platform_name,
@@ -504,7 +627,7 @@ class NotePublisher(Publisher):
         headers = self._get_headers(cookies)
 
         try:
-            async with httpx.AsyncClient() as client:
+            async with self._http() as client:
                 body_html, body_length = self.html_converter.convert(content)
 
                 save_payload = {
@@ -519,7 +642,7 @@ class NotePublisher(Publisher):
                     f"{self.BASE_URL}/api/v1/text_notes/draft_save"
                     f"?id={article_id}&is_temp_saved=true",
                     headers=headers,
-                    json=save_payload,
+                    content=dumps_bytes(save_payload),
                     timeout=30.0,
                 )
 
@@ -559,13 +682,13 @@ class NotePublisher(Publisher):
 
     async def test_login(self) -> bool:
         """Test if current cookies are valid."""
-        cookies = self._load_cookies()
+        cookies = await self._load_cookies()
         if not cookies or "_note_session_v5" not in cookies:
             return False
 
         headers = self._get_headers(cookies)
         try:
-            async with httpx.AsyncClient() as client:
+            async with self._http() as client:
                 resp = await client.get(
                     f"{self.BASE_URL}/api/v2/current_user",
                     headers=headers,
@@ -587,42 +710,55 @@ class NotePublisher(Publisher):
             return False
 
         try:
+            if self._get_browser is not None:
+                return await self._login_with_browser(await self._get_browser())
             async with async_playwright() as p:
-                browser = await p.chromium.launch(headless=True)
-                context = await browser.new_context()
-                page = await context.new_page()
-
-                await page.goto("https://note.com/login")
-                await page.wait_for_load_state("networkidle")
-                await asyncio.sleep(2)
-
-                inputs = await page.query_selector_all("input")
-                if len(inputs) >= 2:
-                    await inputs[0].fill(self.email)
-                    await asyncio.sleep(0.5)
-                    await inputs[1].fill(self.password)
-                    await asyncio.sleep(0.5)
-
-                buttons = await page.query_selector_all("button")
-                for button in buttons:
-                    text = await button.text_content()
-                    if text and "ログイン" in text:
-                        await button.click()
-                        break
-
-                await asyncio.sleep(5)
-                await page.wait_for_load_state("networkidle")
-
-                # Save cookies
-                cookies = await context.cookies()
-                self.cookies_path.write_text(json.dumps(cookies))
-
-                # Verify login
-                session_cookie = next(
-                    (c for c in cookies if c["name"] == "_note_session_v5"), None
-                )
-                await browser.close()
-                return session_cookie is not None
+                # Attach to a shared Chromium (one per host) when configured
+                cdp_endpoint = os.getenv("NOTE_CDP_ENDPOINT")
+                if cdp_endpoint:
+                    browser = await p.chromium.connect_over_cdp(cdp_endpoint)
+                else:
+                    browser = await p.chromium.launch(headless=True)
+                try:
+                    return await self._login_with_browser(browser)
+                finally:
+                    await browser.close()
 
         except Exception:
             return False
+
+    async def _login_with_browser(self, browser: Any) -> bool:
+        """Log in using a fresh context of ``browser`` and save the session cookies."""
+        context = await browser.new_context()
+        try:
+            # The login form needs neither images, fonts nor media
+            await context.route("**/*", _abort_heavy_resources)
+            page = await context.new_page()
+
+            # Return once the response starts; the form wait overlaps with hydration
+            await page.goto("https://note.com/login", wait_until="commit")
+            await page.wait_for_selector('input[type="password"]', state="visible", timeout=20000)
+
+            # Locators resolve inside the page: one round-trip each, no per-element scans
+            await page.locator('input:not([type="password"]):not([type="hidden"])').first.fill(
+                self.email
+            )
+            await page.locator('input[type="password"]').first.fill(self.password)
+            await page.locator('button:has-text("ログイン")').first.click()
+
+            # A successful login navigates away from /login
+            try:
+                await page.wait_for_url(lambda url: "/login" not in url, timeout=15000)
+            except PlaywrightTimeoutError:
+                pass  # decided by the session cookie below
+
+            # Save cookies (and localStorage) in one call
+            state = await context.storage_state(path=str(self.cookies_path))
+
+            # Verify login
+            session_cookie = next(
+                (c for c in state["cookies"] if c["name"] == "_note_session_v5"), None
+            )
+            return session_cookie is not None
+        finally:
+            await context.close()
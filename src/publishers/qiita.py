@@ -17,7 +17,12 @@ class QiitaPublisher(Publisher):
     BASE_URL = "https://qiita.com/api/v2"
     BLOG_BASE_URL = "https://blog.secure-auto-lab.com/articles"
 
-    def __init__(self, access_token: str | None = None):
+    def __init__(
+        self,
+        access_token: str | None = None,
+        client: httpx.AsyncClient | None = None,
+    ):
+        self._client = client
         self.access_token = access_token or os.getenv("QIITA_ACCESS_TOKEN")
         if not self.access_token:
             raise ValueError("QIITA_ACCESS_TOKEN is required")
@@ -27,10 +32,16 @@ class QiitaPublisher(Publisher):
             "Content-Type": "application/json",
         }
 
-    async def publish(self, article: Article, content: str) -> PublishResult:
-        """Publish a new article to Qiita."""
+    @classmethod
+    def is_configured(cls) -> bool:
+        return bool(os.getenv("QIITA_ACCESS_TOKEN"))
+
+    async def publish(
+        self, article: Article, content: str, ogp_path: str | None = None
+    ) -> PublishResult:
+        """Publish a new article to Qiita (ogp_path is accepted but not used)."""
         try:
-            async with httpx.AsyncClient() as client:
+            async with self._http() as client:
                 response = await client.post(
                     f"{self.BASE_URL}/items",
                     headers=self.headers,
@@ -60,7 +71,7 @@ class QiitaPublisher(Publisher):
     async def update(self, article: Article, content: str, article_id: str) -> PublishResult:
         """Update an existing article on Qiita."""
         try:
-            async with httpx.AsyncClient() as client:
+            async with self._http() as client:
                 response = await client.patch(
                     f"{self.BASE_URL}/items/{article_id}",
                     headers=self.headers,
@@ -90,7 +101,7 @@ class QiitaPublisher(Publisher):
     async def delete(self, article_id: str) -> PublishResult:
         """Delete an article from Qiita."""
         try:
-            async with httpx.AsyncClient() as client:
+            async with self._http() as client:
                 response = await client.delete(
                     f"{self.BASE_URL}/items/{article_id}",
                     headers=self.headers,
@@ -1,6 +1,7 @@
 """Zenn publisher using Git-based workflow."""
 from __future__ import annotations
 
+import asyncio
 import os
 import shutil
 import subprocess
@@ -10,6 +11,25 @@ from ..transformer.article import Article
 from .base import Publisher, PublishResult
 
 
+async def _run_git(*args: str, cwd: str) -> None:
+    """Run a git command without blocking the event loop.
+
+    Raises:
+        subprocess.CalledProcessError: If git exits with a non-zero status
+    """
+    proc = await asyncio.create_subprocess_exec(
+        "git", *args,
+        cwd=cwd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    stdout, stderr = await proc.communicate()
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(
+            proc.returncode, ["git", *args], output=stdout, stderr=stderr
+        )
+
+
 class ZennPublisher(Publisher):
     """Publisher for Zenn using GitHub repository integration.
 
@@ -22,7 +42,12 @@ class ZennPublisher(Publisher):
 
     platform_name = "zenn"
 
-    def __init__(self, zenn_content_path: str | None = None):
+    def __init__(
+        self, zenn_content_path: str | None = None, git_lock: asyncio.Lock | None = None
+    ):
+        # git commands in the zenn-content repository must not interleave (index.lock);
+        # publishers of one run share the lock through PublishContext.git_lock
+        self._git_lock = git_lock or asyncio.Lock()
         self.content_path = Path(
             zenn_content_path or os.getenv("ZENN_CONTENT_PATH", "./zenn-content")
         )
@@ -34,24 +59,8 @@ class ZennPublisher(Publisher):
     ) -> PublishResult:
         """Publish article by writing to zenn-content and pushing to GitHub."""
         try:
-            # Ensure directories exist
-            self.articles_path.mkdir(parents=True, exist_ok=True)
-
-            # Copy OGP image and embed in content
-            git_files = [f"articles/{article.slug}.md"]
-            if ogp_path and Path(ogp_path).exists():
-                self.images_path.mkdir(parents=True, exist_ok=True)
-                img_filename = f"{article.slug}-ogp.png"
-                dest = self.images_path / img_filename
-                shutil.copy2(ogp_path, dest)
-                git_files.append(f"images/{img_filename}")
-
-                # Insert OGP image after frontmatter
-                content = self._insert_ogp_image(content, img_filename)
-
-            # Write article file
-            article_file = self.articles_path / f"{article.slug}.md"
-            article_file.write_text(content, encoding="utf-8")
+            # Blocking file I/O runs in a worker thread so concurrent publishes keep going
+            git_files = await asyncio.to_thread(self._write_files, article, content, ogp_path)
 
             # Git operations
             git_result = await self._git_push(
@@ -77,6 +86,28 @@ class ZennPublisher(Publisher):
                 error=str(e),
             )
 
+    def _write_files(self, article: Article, content: str, ogp_path: str | None) -> list[str]:
+        """Write the article (with its OGP image) and return the paths to commit."""
+        # Ensure directories exist
+        self.articles_path.mkdir(parents=True, exist_ok=True)
+
+        # Copy OGP image and embed in content
+        git_files = [f"articles/{article.slug}.md"]
+        if ogp_path and Path(ogp_path).exists():
+            self.images_path.mkdir(parents=True, exist_ok=True)
+            img_filename = f"{article.slug}-ogp.png"
+            dest = self.images_path / img_filename
+            shutil.copy2(ogp_path, dest)
+            git_files.append(f"images/{img_filename}")
+
+            # Insert OGP image after frontmatter
+            content = self._insert_ogp_image(content, img_filename)
+
+        # Write article file
+        article_file = self.articles_path / f"{article.slug}.md"
+        article_file.write_text(content, encoding="utf-8")
+        return git_files
+
     def _insert_ogp_image(self, content: str, img_filename: str) -> str:
         """Insert OGP image reference after frontmatter."""
         # Find end of frontmatter (second ---)
@@ -92,7 +123,7 @@ class ZennPublisher(Publisher):
         """Update existing article (same as publish for Git-based workflow)."""
         try:
             article_file = self.articles_path / f"{article_id}.md"
-            article_file.write_text(content, encoding="utf-8")
+            await asyncio.to_thread(article_file.write_text, content, encoding="utf-8")
 
             git_result = await self._git_push(
                 [f"articles/{article_id}.md"], f"Update article: {article.title}"
@@ -179,29 +210,10 @@ class ZennPublisher(Publisher):
         try:
             cwd = str(self.content_path)
 
-            # Git add all files
-            subprocess.run(
-                ["git", "add"] + files,
-                cwd=cwd,
-                check=True,
-                capture_output=True,
-            )
-
-            # Git commit
-            subprocess.run(
-                ["git", "commit", "-m", commit_message],
-                cwd=cwd,
-                check=True,
-                capture_output=True,
-            )
-
-            # Git push
-            subprocess.run(
-                ["git", "push", "origin", "main"],
-                cwd=cwd,
-                check=True,
-                capture_output=True,
-            )
+            async with self._git_lock:
+                await _run_git("add", *files, cwd=cwd)
+                await _run_git("commit", "-m", commit_message, cwd=cwd)
+                await _run_git("push", "origin", "main", cwd=cwd)
 
             return True
 
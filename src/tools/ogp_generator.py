@@ -295,6 +295,7 @@ class OgpGenerator:
         output: str,
         author: str = "secure_auto_lab",
         theme: str = "default",
+        browser: Any = None,
     ) -> str:
         """Generate OGP image.
 
@@ -304,28 +305,36 @@ class OgpGenerator:
             output: Output PNG file path
             author: Author name
             theme: Color theme (default, purple, green, orange)
+            browser: Already-launched Playwright browser to reuse (optional)
 
         Returns:
             Path to the saved image
         """
         html_content = _build_html(title, tags, author, theme)
+        output_path = Path(output)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        if browser is not None:
+            await self._screenshot(browser, html_content, output_path)
+            return str(output_path)
 
         async with async_playwright() as p:
             browser = await p.chromium.launch()
-            page = await browser.new_page(
-                viewport={"width": 1200, "height": 630}
-            )
+            await self._screenshot(browser, html_content, output_path)
+            await browser.close()
+
+        return str(output_path)
+
+    async def _screenshot(self, browser: Any, html_content: str, output_path: Path) -> None:
+        """Render the HTML in a new page of ``browser`` and save a screenshot."""
+        page = await browser.new_page(viewport={"width": 1200, "height": 630})
+        try:
             await page.set_content(html_content, wait_until="networkidle")
             # Wait for Google Fonts to load
             await page.wait_for_timeout(1500)
-
-            output_path = Path(output)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-
             await page.screenshot(path=str(output_path))
-            await browser.close()
-
-        return str(output_path)
+        finally:
+            await page.close()
 
     async def generate_from_article(
         self,
@@ -4,6 +4,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
 from typing import Any
 
 
@@ -102,6 +103,11 @@ class Article:
     # Source file path
     source_path: str | None = None
 
+    @cached_property
+    def hashtags(self) -> tuple[str, ...]:
+        """Tags formatted as SNS hashtags ("#tag"), built once per article."""
+        return tuple(f"#{tag}" for tag in self.tags)
+
     def get_enabled_platforms(self) -> list[str]:
         """Return list of enabled platform names."""
         enabled = []
@@ -16,6 +16,14 @@ class PlatformConverter(ABC):
         """Convert article content to platform-specific format."""
         pass
 
+    def convert_prefix(self, article: Article, max_chars: int) -> str:
+        """Return the first ``max_chars`` characters of ``convert(article)``.
+
+        Converters that can produce a prefix without converting the whole
+        article override this; the default converts fully and slices.
+        """
+        return self.convert(article)[:max_chars]
+
     def _strip_platform_blocks(self, content: str, keep_platform: str) -> str:
         """Remove platform-specific blocks except for the specified platform."""
         # Pattern: <!-- platform:xxx --> ... <!-- endplatform -->
@@ -435,6 +443,13 @@ class BlogConverter(PlatformConverter):
 
         return f"{frontmatter}\n\n{content}"
 
+    def convert_prefix(self, article: Article, max_chars: int) -> str:
+        # Without platform blocks the body is copied verbatim, so only its head is needed
+        if "<!-- platform:" in article.content:
+            return super().convert_prefix(article, max_chars)
+        frontmatter = self._generate_frontmatter(article)
+        return f"{frontmatter}\n\n{article.content[:max_chars]}"[:max_chars]
+
     def _generate_frontmatter(self, article: Article) -> str:
         """Generate Astro-compatible frontmatter."""
         tags_str = ", ".join(f'"{t}"' for t in article.tags)
@@ -461,13 +476,19 @@ class ConverterFactory:
         "blog": BlogConverter,
     }
 
+    # Converters hold no per-article state, so one instance per platform is reused
+    _instances: dict[str, PlatformConverter] = {}
+
     @classmethod
     def get_converter(cls, platform: str) -> PlatformConverter:
         """Get converter for specified platform."""
-        converter_class = cls._converters.get(platform)
-        if not converter_class:
-            raise ValueError(f"Unknown platform: {platform}")
-        return converter_class()
+        converter = cls._instances.get(platform)
+        if converter is None:
+            converter_class = cls._converters.get(platform)
+            if not converter_class:
+                raise ValueError(f"Unknown platform: {platform}")
+            converter = cls._instances.setdefault(platform, converter_class())
+        return converter
 
     @classmethod
     def convert_all(cls, article: Article) -> dict[str, str]: